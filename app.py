@@ -1,46 +1,341 @@
 # CoopHive Tweet Review Flask App
 # Simple, professional web app for reviewing and editing AI-generated tweets
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, make_response
-from werkzeug.security import check_password_hash, generate_password_hash
-import json
+from flask import Flask, Response, g, has_request_context, render_template, request, jsonify, redirect
+from flask.json.provider import JSONProvider
+import atexit
+import copy
+import logging
 import os
+import queue
+import re
+import sys
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
+from itertools import chain, islice
+from operator import itemgetter
 import csv
+import gzip
+import hashlib
 import io
-from datetime import datetime
 import secrets
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from database import save_campaign_data, get_campaign_data, update_tweet_content, update_tweet_status, init_database, check_duplicate_scraped_tweets, save_scraped_tweets, get_scraped_tweets, get_scraped_tweets_stats, get_database_status, force_migration, backup_database, delete_campaign_cascade, bulk_delete_scraped_tweets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import ijson
+from werkzeug.exceptions import RequestEntityTooLarge
+import orjson
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from database import save_campaign_data, save_campaigns_bulk, get_campaign_data, update_tweet_content, update_tweet_status, init_database, check_duplicate_scraped_tweets, save_scraped_tweets, iter_scraped_tweets, get_scraped_tweets_page, get_scraped_tweets_stats, get_status_tweets_page, decode_keyset_cursor, iter_all_tweets, iter_all_tweet_csv_rows, get_database_status, force_migration, backup_database, dispose_engine, remove_session, update_campaign_display_name, delete_campaign_cascade, bulk_delete_scraped_tweets, get_session, Campaign, Tweet
+
+# ============================================================================
+# LOGGING - records are handed to a queue and written by a listener thread,
+# so request threads never block on stdout
+# ============================================================================
+
+logger = logging.getLogger('xbot')
+_log_level_name = (os.environ.get('LOG_LEVEL') or 'INFO').upper()
+_log_level = logging.getLevelNamesMapping().get(_log_level_name)
+logger.setLevel(logging.INFO if _log_level is None else _log_level)
+logger.propagate = False
+if not logger.handlers:
+    _log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(_log_queue))
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    _log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+if _log_level is None:
+    logger.warning("Unknown LOG_LEVEL %r - using INFO", _log_level_name)
 
 # Initialize database on startup
-print("DEBUG: Initializing database...")
+logger.debug("Initializing database...")
 try:
     init_database()
-    print("DEBUG: Database initialized successfully")
+    # Hand pooled connections back to the server cleanly when the process exits
+    atexit.register(dispose_engine)
+    logger.debug("Database initialized successfully")
 except Exception as e:
-    print(f"DEBUG: Database initialization failed: {e}")
+    logger.error("Database initialization failed: %s", e)
+
+# ============================================================================
+# JSON (orjson) - faster parsing and serialization than stdlib json
+# ============================================================================
+
+class OrJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for get_json() and jsonify()"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Pre-serialized bodies for the common fixed-shape error responses
+_ERR_NO_CAMPAIGN = orjson.dumps({'status': 'error', 'message': 'Campaign not found'})
+_ERR_NO_TWEET = orjson.dumps({'status': 'error', 'message': 'Tweet not found'})
+_ERR_BAD_JSON = orjson.dumps({'status': 'error', 'message': 'Invalid JSON format'})
+_ERR_MISSING_BATCH = orjson.dumps({'status': 'error', 'message': 'Missing campaign_batch'})
+_ERR_BATCH_REQUIRED = orjson.dumps({'status': 'error', 'message': 'campaign_batch is required'})
+_ERR_BAD_CURSOR = orjson.dumps({'status': 'error', 'message': 'Invalid cursor'})
+
+def _ojson(payload, status=200):
+    """Build a JSON response directly from orjson bytes"""
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return Response(body, status=status, headers=_JSON_HEADERS)
+
+def _body_etag(body):
+    """Short blake2b digest of a response body for use as a weak ETag"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def _conditional(body, mimetype, etag=None):
+    """Serve a body with a weak ETag, answering 304 when the client already has it"""
+    etag = etag or _body_etag(body)
+    compressible = _compressible(mimetype, len(body))
+    if compressible and _accepts_gzip():
+        # compress_response gzips this body, and the gzip variant carries its own ETag
+        etag += _GZIP_ETAG_SUFFIX
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.set_etag(etag, weak=True)
+    if compressible:
+        response.vary.add('Accept-Encoding')
+    return response
+
+# Largest JSON request body the API will parse (bytes)
+_MAX_JSON_BODY = int(os.environ.get('MAX_JSON_BODY', 8 * 1024 * 1024))
+
+def _request_json():
+    """Parse the request body with orjson once per request, without keeping the raw bytes around"""
+    body = g.get('_json_body')
+    if body is None:
+        if (request.content_length or 0) > _MAX_JSON_BODY:
+            raise RequestEntityTooLarge()
+        raw = request.get_data(cache=False)
+        try:
+            body = orjson.loads(raw) if raw else {}
+        except orjson.JSONDecodeError as e:
+            body = e
+        g._json_body = body
+    if isinstance(body, orjson.JSONDecodeError):
+        raise body
+    return body
 
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
+app.json = OrJSONProvider(app)
+# Hard cap on any request body (JSON uploads stream through ijson, so this can sit well above _MAX_JSON_BODY)
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', 64 * 1024 * 1024))
+# Shared key from the environment so every worker signs sessions the same way
+app.secret_key = os.environ.get('SECRET_KEY')
+if not app.secret_key:
+    if os.environ.get('FLASK_ENV') != 'development':
+        logger.warning("SECRET_KEY is not set - using a per-process random key (sessions won't survive restarts or span workers)")
+    app.secret_key = secrets.token_hex(16)
+
+# Pooled keep-alive session for n8n webhook calls (connect errors and 502/503/504 are
+# retried; POSTs are not replayed on a status retry, so a tweet is never double-posted)
+N8N_WEBHOOK_URL = os.environ.get('N8N_WEBHOOK_URL')
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])))
+
+# Optional background writer for receive_tweets (ASYNC_INGEST=1): the request returns 202
+# as soon as the payload is validated, and a bounded queue sheds load with 503 when full
+ASYNC_INGEST = os.environ.get('ASYNC_INGEST') == '1'
+_db_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='db')
+_db_slots = threading.BoundedSemaphore(int(os.environ.get('ASYNC_INGEST_QUEUE', '32')))
+
+def _submit_campaign_save(campaign_data):
+    """Queue save_campaign_data on the background pool; returns False when the queue is full"""
+    if not _db_slots.acquire(blocking=False):
+        return False
+    
+    def _run():
+        try:
+            if not save_campaign_data(campaign_data):
+                logger.error("Background save failed for campaign %s", campaign_data.get('campaign_batch'))
+            _clear_response_cache()
+        except Exception as e:
+            logger.error("Background save error: %s", e)
+        finally:
+            _db_slots.release()
+    
+    _db_pool.submit(_run)
+    return True
+
+# Compiled templates for the hot review path, resolved once instead of by name on every
+# request (left as names in development so template edits still auto-reload)
+if os.environ.get('FLASK_ENV') == 'development':
+    _REVIEW_TPL, _ERROR_TPL = 'review.html', 'error.html'
+else:
+    _REVIEW_TPL = app.jinja_env.get_template('review.html')
+    _ERROR_TPL = app.jinja_env.get_template('error.html')
+
+# Rendered HTML for pages whose output depends only on constant arguments
+_STATIC_HTML = {}
+_STATIC_CACHE_CONTROL = 'public, max-age=60'
+
+def _render_static(name, **context):
+    """Render a request-independent page once and serve the cached HTML afterwards"""
+    if app.debug or app.jinja_env.auto_reload:
+        return render_template(name, **context)
+    key = (name, tuple(sorted(context.items())))
+    cached = _STATIC_HTML.get(key)
+    if cached is None:
+        body = render_template(name, **context).encode('utf-8')
+        cached = _STATIC_HTML[key] = (body, _body_etag(body))
+    response = _conditional(cached[0], 'text/html', etag=cached[1])
+    # The page shells load their data from the API, so browsers may reuse them briefly
+    response.headers['Cache-Control'] = _STATIC_CACHE_CONTROL
+    return response
+
+# Short-lived cache of serialized JSON for read-heavy polling endpoints, keyed by endpoint.
+# Every successful write request to the API clears it (see clear_response_cache_on_write).
+# Each clear bumps the generation, so a build that was already running when a write
+# committed is served once but never stored over the clear.
+_response_cache = {}
+_response_cache_generation = 0
+_response_cache_lock = threading.Lock()
+
+def _clear_response_cache():
+    """Drop cached API responses and invalidate builds still in flight"""
+    global _response_cache_generation
+    with _response_cache_lock:
+        _response_cache_generation += 1
+        _response_cache.clear()
+
+def _cached_json(key, ttl, build, conditional=False):
+    """Serve build()'s payload as JSON, reusing the serialized bytes for ttl seconds (with an ETag if conditional)"""
+    cached = _response_cache.get(key)
+    if not cached or cached[2] <= time.monotonic():
+        generation = _response_cache_generation
+        body = orjson.dumps(build())
+        cached = (body, _body_etag(body), time.monotonic() + ttl)
+        with _response_cache_lock:
+            if generation == _response_cache_generation:
+                _response_cache[key] = cached
+    if conditional:
+        return _conditional(cached[0], 'application/json', etag=cached[1])
+    return _ojson(cached[0])
 
 # Authentication removed - direct access to all endpoints
 
 # Database storage for production (with fallback to in-memory for demo)
-tweet_storage = {}  # Fallback for demo mode
+class CampaignStore(OrderedDict):
+    """Size-bounded, thread-safe in-memory campaign store (least recently used is evicted)"""
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            return self[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                evicted, _ = self.popitem(last=False)
+                logger.debug("Evicted campaign '%s' from memory storage", evicted)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    # Snapshots, so iterating callers never race a concurrent reorder/eviction
+    def keys(self):
+        with self._lock:
+            return list(super().keys())
+
+    def items(self):
+        with self._lock:
+            return list(super().items())
+
+tweet_storage = CampaignStore(maxsize=int(os.environ.get('TWEET_CACHE_MAX', '256')))  # Fallback for demo mode
+
+def _index_tweets(campaign_data):
+    """Build the id -> tweet index for an in-memory campaign"""
+    campaign_data['_by_id'] = {tweet['id']: tweet for tweet in campaign_data.get('tweets') or ()}
+    return campaign_data['_by_id']
+
+def _find_tweet(campaign_data, tweet_id):
+    """O(1) tweet lookup in an in-memory campaign (index is built on first use)"""
+    by_id = campaign_data.get('_by_id')
+    if by_id is None:
+        by_id = _index_tweets(campaign_data)
+    return by_id.get(tweet_id)
+
+def _now_dt():
+    """Current local datetime, read from the clock once per request"""
+    now = g.get('_now_dt')
+    if now is None:
+        now = g._now_dt = datetime.now()
+    return now
+
+def _now():
+    """Current local timestamp as an ISO string, computed once per request"""
+    now_iso = g.get('_now_iso')
+    if now_iso is None:
+        now_iso = g._now_iso = _now_dt().isoformat()
+    return now_iso
+
+def _now_stamp():
+    """Current local timestamp as YYYYmmdd_HHMMSS for batch names and file names"""
+    stamp = g.get('_now_stamp')
+    if stamp is None:
+        stamp = g._now_stamp = _now_dt().strftime("%Y%m%d_%H%M%S")
+    return stamp
+
+@app.teardown_appcontext
+def _remove_db_session(exc):
+    """Return the request's scoped database session to the pool"""
+    remove_session()
 
 # ============================================================================
-# SECURITY HEADERS & LOGGING MIDDLEWARE
+# SECURITY HEADERS, COMPRESSION & LOGGING MIDDLEWARE
 # ============================================================================
 
+# Static security headers applied to every response
+_SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+    'Content-Security-Policy': "default-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'",
+}
+
 @app.after_request
 def add_security_headers(response):
     """Add security headers to all responses"""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Content-Security-Policy'] = "default-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
+    response.headers.update(_SECURITY_HEADERS)
     
     # Add execution ID to response headers if available in request
     if hasattr(request, 'execution_id'):
@@ -48,13 +343,90 @@ def add_security_headers(response):
     
     return response
 
+@app.after_request
+def clear_response_cache_on_write(response):
+    """Drop cached API responses once a write request has succeeded"""
+    if request.method not in ('GET', 'HEAD') and response.status_code < 400:
+        _clear_response_cache()
+    return response
+
+# Text responses worth compressing (HTML pages, JSON API, CSV exports)
+_COMPRESS_MIMETYPES = {'text/html', 'application/json', 'text/csv'}
+_COMPRESS_MIN_SIZE = 1024
+# Appended to the ETag of a gzipped body so it never matches the identity representation
+_GZIP_ETAG_SUFFIX = '-gzip'
+
+def _accepts_gzip():
+    """Whether the current request accepts gzip (q-values honored, so gzip;q=0 means no)"""
+    return request.accept_encodings['gzip'] > 0
+
+def _compressible(mimetype, size):
+    """Whether compress_response gzips a buffered body of this type and size for gzip clients"""
+    return mimetype in _COMPRESS_MIMETYPES and size >= _COMPRESS_MIN_SIZE
+
+def _mark_gzipped(response):
+    """Headers for a gzipped body; a base ETag from _conditional becomes the gzip variant's ETag"""
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    etag, weak = response.get_etag()
+    if etag and not etag.endswith(_GZIP_ETAG_SUFFIX):
+        response.set_etag(etag + _GZIP_ETAG_SUFFIX, weak=weak)
+
+def _gzip_stream(chunks):
+    """Gzip a streamed body chunk by chunk, without buffering the whole response"""
+    compressor = zlib.compressobj(4, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode() if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Gzip text responses of 1 KB or more (and streamed ones such as CSV exports) when the client accepts gzip"""
+    if (response.mimetype not in _COMPRESS_MIMETYPES
+            or response.status_code != 200
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or not _accepts_gzip()):
+        return response
+    
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response)
+        response.headers.pop('Content-Length', None)
+        _mark_gzipped(response)
+        return response
+    
+    data = response.get_data()
+    if not _compressible(response.mimetype, len(data)):
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=4))
+    _mark_gzipped(response)
+    return response
+
+# Methods whose requests may carry a JSON body
+_BODY_METHODS = frozenset(('POST', 'PUT', 'PATCH'))
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    """Answer oversized bodies with the API's JSON error shape"""
+    return _ojson({'status': 'error', 'message': 'Request body too large'}, 413)
+
 @app.before_request
 def log_request_info():
     """Enhanced logging for all requests, especially authenticated ones"""
     # Extract execution ID from request if present
     execution_id = None
-    if request.is_json and request.get_json(silent=True):
-        json_data = request.get_json(silent=True)
+    is_api = request.path.startswith('/api/')
+    # Only API JSON bodies carry an execution ID; the parsed body is reused by the view
+    json_data = None
+    if is_api and request.method in _BODY_METHODS and request.is_json:
+        try:
+            json_data = _request_json()
+        except orjson.JSONDecodeError:
+            pass
+    if json_data:
         # Handle both array format (like in.json) and direct object format
         if isinstance(json_data, list) and len(json_data) > 0:
             execution_id = json_data[0].get('execution_id')
@@ -70,26 +442,54 @@ def log_request_info():
         request.execution_id = execution_id
     
     # Enhanced logging for API endpoints
-    if request.path.startswith('/api/'):
-        log_msg = f"API Request: {request.method} {request.path}"
-        
-        if execution_id:
-            log_msg += f" | Execution-ID: {execution_id}"
-        
-        if request.remote_addr:
-            log_msg += f" | IP: {request.remote_addr}"
-        
-        print(f"SECURITY LOG: {log_msg}")
+    if is_api:
+        exec_part = f" | Execution-ID: {execution_id}" if execution_id else ""
+        ip_part = f" | IP: {request.remote_addr}" if request.remote_addr else ""
+        logger.info("SECURITY LOG: API Request: %s %s%s%s", request.method, request.path, exec_part, ip_part)
+
+# Opt-in per-request query statistics (LOG_QUERY_STATS=1): query count and time for every request,
+# plus a warning when one statement shape repeats _REPEATED_QUERY_LIMIT or more times (likely N+1)
+_LOG_QUERY_STATS = os.environ.get('LOG_QUERY_STATS') == '1'
+_REPEATED_QUERY_LIMIT = 3
+# Literals and expanded IN (...) parameter lists, stripped so repeated queries compare equal
+_SQL_VARIABLE_PARTS = re.compile(r"'[^']*'|\b\d+\b|\((?:\s*(?:\?|%\(\w+\)s|%s)\s*,?)+\)")
+
+if _LOG_QUERY_STATS:
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def _start_request_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info['request_query_start'] = time.perf_counter()
+    
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def _record_request_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            elapsed = time.perf_counter() - conn.info['request_query_start']
+            g.setdefault('_queries', []).append((statement, elapsed))
+    
+    @app.after_request
+    def log_query_stats(response):
+        """Log the request's query count and time, flagging repeated statements"""
+        queries = g.get('_queries')
+        if queries:
+            total_ms = sum(elapsed for _, elapsed in queries) * 1000
+            logger.info("Queries for %s %s: %d in %.1f ms", request.method, request.path, len(queries), total_ms)
+            shapes = {}
+            for statement, _ in queries:
+                shape = _SQL_VARIABLE_PARTS.sub('?', statement)
+                shapes[shape] = shapes.get(shape, 0) + 1
+            for shape, count in shapes.items():
+                if count >= _REPEATED_QUERY_LIMIT:
+                    logger.warning("Possible N+1 on %s: %d x %s", request.path, count, shape)
+        return response
 
 @app.route('/')
 def index():
     """Home page - simple welcome with upload"""
-    return render_template('index.html')
+    return _render_static('index.html')
 
 @app.route('/campaigns')
 def campaigns_page():
     """Campaigns management page"""
-    return render_template('campaigns.html')
+    return _render_static('campaigns.html')
 
 @app.route('/upload')
 def upload_page():
@@ -99,42 +499,42 @@ def upload_page():
 @app.route('/duplicate-check')
 def duplicate_check_page():
     """Duplicate check upload page"""
-    return render_template('duplicate_check.html')
+    return _render_static('duplicate_check.html')
 
 @app.route('/status')
 def status_page():
     """System status page"""
-    return render_template('status.html')
+    return _render_static('status.html')
 
 @app.route('/drafts')
 def drafts_page():
     """Draft tweets page"""
-    return render_template('status_page.html', status='Draft', title='Draft Tweets')
+    return _render_static('status_page.html', status='Draft', title='Draft Tweets')
 
 @app.route('/approved')
 def approved_page():
     """Approved tweets page"""
-    return render_template('status_page.html', status='Approved', title='Approved Tweets')
+    return _render_static('status_page.html', status='Approved', title='Approved Tweets')
 
 @app.route('/posted')
 def posted_page():
     """Posted tweets page"""
-    return render_template('status_page.html', status='Posted', title='Posted Tweets')
+    return _render_static('status_page.html', status='Posted', title='Posted Tweets')
 
 @app.route('/rejected')
 def rejected_page():
     """Rejected tweets page"""
-    return render_template('status_page.html', status='Rejected', title='Rejected Tweets')
+    return _render_static('status_page.html', status='Rejected', title='Rejected Tweets')
 
 @app.route('/deleted')
 def deleted_page():
     """Deleted tweets page"""
-    return render_template('status_page.html', status='Deleted', title='Deleted Tweets')
+    return _render_static('status_page.html', status='Deleted', title='Deleted Tweets')
 
 @app.route('/all-tweets')
 def all_tweets_page():
     """All tweets page with CSV download"""
-    return render_template('all_tweets.html')
+    return _render_static('all_tweets.html')
 
 @app.route('/scraped-tweets')
 def scraped_tweets_page():
@@ -147,8 +547,15 @@ def scraped_tweets_page():
     # Get execution_id filter if provided
     execution_id = request.args.get('execution_id', None)
     
+    # Keyset cursor handed out by the previous page's "next" link (page jumps use OFFSET)
+    cursor = request.args.get('cursor', None)
+    if cursor and decode_keyset_cursor(cursor) is None:
+        # Unreadable cursor - serve the requested page number by OFFSET instead
+        logger.debug("Ignoring invalid scraped tweets cursor")
+        cursor = None
+    
     # Get tweets with pagination
-    tweets_data, total_count = get_scraped_tweets(limit=per_page, offset=offset, execution_id=execution_id)
+    tweets_data, total_count, next_cursor = get_scraped_tweets_page(per_page, page=page, cursor=cursor, execution_id=execution_id)
     
     # Calculate pagination info
     total_pages = (total_count + per_page - 1) // per_page
@@ -168,6 +575,7 @@ def scraped_tweets_page():
         'has_next': has_next,
         'prev_num': page - 1 if has_prev else None,
         'next_num': page + 1 if has_next else None,
+        'next_cursor': next_cursor if has_next else None,
         'start_index': offset + 1 if tweets_data else 0,
         'end_index': min(offset + per_page, total_count)
     }
@@ -182,55 +590,54 @@ def scraped_tweets_page():
 def review_tweets(campaign_batch):
     """Main tweet review interface - Direct access, no authentication required"""
     
-    # DEBUG: Print available campaigns
-    print(f"DEBUG: Looking for campaign '{campaign_batch}'")
-    print(f"DEBUG: Available in memory: {list(tweet_storage.keys())}")
+    logger.debug("Looking for campaign '%s'", campaign_batch)
     
     # Get tweet data from DATABASE FIRST, fallback to memory only if needed
     campaign_data = get_campaign_data(campaign_batch) or tweet_storage.get(campaign_batch)
     
     # DEBUG: Print campaign data structure
     if campaign_data:
-        print(f"DEBUG: Campaign data keys: {campaign_data.keys()}")
+        logger.debug("Campaign data keys: %s", campaign_data.keys())
         if 'tweets' in campaign_data:
-            print(f"DEBUG: Number of tweets: {len(campaign_data['tweets'])}")
+            logger.debug("Number of tweets: %s", len(campaign_data['tweets']))
         else:
-            print("DEBUG: No 'tweets' key found in campaign data")
+            logger.debug("No 'tweets' key found in campaign data")
     else:
-        print("DEBUG: No campaign data found")
+        logger.debug("No campaign data found")
     
     # If no data found, show error
     if not campaign_data:
-        return render_template('error.html', 
+        return render_template(_ERROR_TPL, 
                              error=f"Campaign '{campaign_batch}' not found. Please upload the campaign data first. Available campaigns: {list(tweet_storage.keys())}"), 404
     
     # NO ACCESS CONTROL! If no tweets found, use sample data temporarily while we debug database
     if 'tweets' not in campaign_data or not campaign_data['tweets']:
-        print(f"DEBUG: No tweets found in campaign {campaign_batch}")
-        print(f"DEBUG: Campaign data structure: {list(campaign_data.keys()) if campaign_data else 'None'}")
+        logger.debug("No tweets found in campaign %s", campaign_batch)
+        logger.debug("Campaign data structure: %s", list(campaign_data.keys()) if campaign_data else 'None')
         
         # Try to reload from database with debug info
         fresh_data = get_campaign_data(campaign_batch)
         if fresh_data and fresh_data.get('tweets'):
-            print(f"DEBUG: Found {len(fresh_data['tweets'])} tweets in fresh database query")
+            logger.debug("Found %s tweets in fresh database query", len(fresh_data['tweets']))
             campaign_data = fresh_data
         else:
-            print(f"DEBUG: No tweets found even in fresh database query - database might need reset")
+            logger.debug("No tweets found even in fresh database query - database might need reset")
             # Always use sample data as fallback to ensure pages work
-            print(f"DEBUG: Using sample data as fallback")
+            logger.debug("Using sample data as fallback")
             sample_data = get_sample_data()
-            campaign_data['tweets'] = sample_data['tweets']
+            campaign_data['tweets'] = copy.deepcopy(sample_data['tweets'])
+            _index_tweets(campaign_data)
             tweet_storage[campaign_batch] = campaign_data
     
-    return render_template('review.html', 
+    return render_template(_REVIEW_TPL, 
                          campaign=campaign_data,
                          campaign_batch=campaign_batch)
 
-@app.route('/api/receive-tweets', methods=['POST'])
+@app.route('/api/receive-tweets', methods=['POST'], provide_automatic_options=False)
 def receive_tweets():
     """Endpoint to receive tweet data from n8n workflow"""
     try:
-        raw_data = request.get_json()
+        raw_data = _request_json()
         
         # Handle array format from n8n (like in.json)
         if isinstance(raw_data, list) and len(raw_data) > 0:
@@ -241,49 +648,82 @@ def receive_tweets():
         campaign_batch = data.get('campaign_batch')
         
         if campaign_batch:
+            tweets = data.get('tweets') or ()
+            tweet_count = len(tweets)
+            
+            # Every tweet must be an object carrying an id before ids can be compared
+            for i, tweet in enumerate(tweets):
+                if not isinstance(tweet, dict) or not tweet.get('id'):
+                    return _ojson({
+                        'status': 'error',
+                        'message': f'Tweet {i+1} must be an object with an "id" field',
+                        'campaign_batch': campaign_batch
+                    }, 400)
+            
+            # Duplicate ids within one payload would fail the insert - catch them in a single pass
+            if len({tweet.get('id') for tweet in tweets}) != tweet_count:
+                return _ojson({
+                    'status': 'error',
+                    'message': f'Duplicate tweet IDs in payload for campaign {campaign_batch}',
+                    'campaign_batch': campaign_batch
+                }, 400)
+            
             # Add title and description for n8n data
             if 'title' not in data:
-                tweet_count = len(data.get('tweets', []))
                 data['title'] = f'N8N Workflow - {tweet_count} tweets'
-                data['description'] = f'Generated by n8n workflow on {datetime.now().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets'
+                data['description'] = f'Generated by n8n workflow on {_now_dt().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets'
                 data['source_type'] = 'n8n_workflow'
             
+            if ASYNC_INGEST:
+                if not _submit_campaign_save(data):
+                    return _ojson({
+                        'status': 'error',
+                        'message': 'Ingest queue is full, retry shortly',
+                        'campaign_batch': campaign_batch
+                    }, 503)
+                return _ojson({
+                    'status': 'accepted',
+                    'message': f'Received {tweet_count} tweets (queued for database)',
+                    'campaign_batch': campaign_batch
+                }, 202)
+            
             # Save to database ONLY - no memory fallback
             if save_campaign_data(data):
-                return jsonify({
+                return _ojson({
                     'status': 'success',
-                    'message': f'Received {len(data.get("tweets", []))} tweets (saved to database)',
+                    'message': f'Received {tweet_count} tweets (saved to database)',
                     'campaign_batch': campaign_batch
                 })
             else:
                 # Check if it's a conflict error
-                return jsonify({
+                return _ojson({
                     'status': 'error',
                     'message': f'Failed to save campaign {campaign_batch}. Campaign or tweet IDs already exist in database. Use unique IDs or check existing campaigns.',
                     'campaign_batch': campaign_batch
-                }), 409
+                }, 409)
         else:
-            return jsonify({'status': 'error', 'message': 'Missing campaign_batch'}), 400
+            return _ojson(_ERR_MISSING_BATCH, 400)
             
+    except orjson.JSONDecodeError:
+        return _ojson(_ERR_BAD_JSON, 400)
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return _ojson({'status': 'error', 'message': str(e)}, 500)
 
-@app.route('/api/save-tweet', methods=['POST'])
+@app.route('/api/save-tweet', methods=['POST'], provide_automatic_options=False)
 def save_tweet():
     """Save edited tweet content"""
     try:
-        data = request.get_json()
+        data = _request_json()
         campaign_batch = data.get('campaign_batch')
         tweet_id = data.get('tweet_id')
         new_content = data.get('content')
         
         # DEBUG: Check what we have
-        print(f"DEBUG: Save tweet - looking for campaign '{campaign_batch}'")
-        print(f"DEBUG: Available campaigns: {list(tweet_storage.keys())}")
+        logger.debug("Save tweet - looking for campaign '%s'", campaign_batch)
         
         # Try database FIRST
         if update_tweet_content(campaign_batch, tweet_id, new_content):
-            return jsonify({
+            return _ojson({
                 'status': 'success',
                 'message': 'Tweet saved successfully (database)',
                 'character_count': len(new_content)
@@ -291,47 +731,40 @@ def save_tweet():
         
         # Fallback to in-memory storage only if database fails
         elif campaign_batch in tweet_storage:
-            campaign_data = tweet_storage[campaign_batch]
-            for tweet in campaign_data.get('tweets', []):
-                if tweet['id'] == tweet_id:
-                    tweet['content'] = new_content
-                    tweet['character_count'] = len(new_content)
-                    tweet['is_edited'] = True
-                    tweet['last_modified'] = datetime.now().isoformat()
-                    break
+            tweet = _find_tweet(tweet_storage[campaign_batch], tweet_id)
+            if tweet:
+                tweet['content'] = new_content
+                tweet['character_count'] = len(new_content)
+                tweet['is_edited'] = True
+                tweet['last_modified'] = _now()
             
-            return jsonify({
+            return _ojson({
                 'status': 'warning',
                 'message': 'Tweet saved successfully (memory fallback - database issue)',
                 'character_count': len(new_content)
             })
         else:
-            return jsonify({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found anywhere. Available: {list(tweet_storage.keys())}'}), 404
+            return _ojson({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found anywhere. Available: {list(tweet_storage.keys())}'}, 404)
             
+    except orjson.JSONDecodeError:
+        return _ojson(_ERR_BAD_JSON, 400)
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return _ojson({'status': 'error', 'message': str(e)}, 500)
 
-@app.route('/api/post-to-x', methods=['POST'])
+@app.route('/api/post-to-x', methods=['POST'], provide_automatic_options=False)
 def post_to_x():
     """Trigger n8n webhook to post tweet to X.com"""
     try:
-        data = request.get_json()
+        data = _request_json()
         tweet_id = data.get('tweet_id')
         campaign_batch = data.get('campaign_batch')
         
         # DEBUG: Check what we have
-        print(f"DEBUG: Post to X - looking for campaign '{campaign_batch}'")
-        print(f"DEBUG: Available campaigns: {list(tweet_storage.keys())}")
+        logger.debug("Post to X - looking for campaign '%s'", campaign_batch)
         
         # Get tweet content from memory first
         if campaign_batch in tweet_storage:
-            campaign_data = tweet_storage[campaign_batch]
-            tweet_to_post = None
-            
-            for tweet in campaign_data.get('tweets', []):
-                if tweet['id'] == tweet_id:
-                    tweet_to_post = tweet
-                    break
+            tweet_to_post = _find_tweet(tweet_storage[campaign_batch], tweet_id)
             
             if tweet_to_post:
                 # Prepare webhook payload
@@ -343,65 +776,98 @@ def post_to_x():
                     'campaign_batch': campaign_batch
                 }
                 
-                # In a real implementation, send to n8n webhook
-                # webhook_url = "https://n8n.coophive.com/webhook/post-to-x"
-                # response = requests.post(webhook_url, json=webhook_payload)
+                # Send to the n8n webhook when configured (demo mode just marks as posted)
+                if N8N_WEBHOOK_URL:
+                    webhook_response = _http.post(N8N_WEBHOOK_URL, data=orjson.dumps(webhook_payload),
+                                                  headers=_JSON_HEADERS, timeout=(2, 5))
+                    webhook_response.raise_for_status()
                 
-                # For demo, just mark as posted
                 tweet_to_post['status'] = 'Posted'
-                tweet_to_post['posted_date'] = datetime.now().isoformat()
+                tweet_to_post['posted_date'] = _now()
                 
-                return jsonify({
+                return _ojson({
                     'status': 'success',
                     'message': 'Tweet posted to X.com successfully!',
                     'tweet_id': tweet_id
                 })
             else:
-                return jsonify({'status': 'error', 'message': 'Tweet not found'}), 404
+                return _ojson(_ERR_NO_TWEET, 404)
         else:
-            return jsonify({'status': 'error', 'message': 'Campaign not found'}), 404
+            return _ojson(_ERR_NO_CAMPAIGN, 404)
             
+    except orjson.JSONDecodeError:
+        return _ojson(_ERR_BAD_JSON, 400)
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return _ojson({'status': 'error', 'message': str(e)}, 500)
 
-@app.route('/api/update-status', methods=['POST'])
+@app.route('/api/update-status', methods=['POST'], provide_automatic_options=False)
 def update_status():
     """Update tweet status (Draft/Approved/Rejected)"""
     try:
-        data = request.get_json()
+        data = _request_json()
         campaign_batch = data.get('campaign_batch')
         tweet_id = data.get('tweet_id')
         new_status = data.get('status')
         
         # DEBUG: Check what we have
-        print(f"DEBUG: Update status - looking for campaign '{campaign_batch}'")
-        print(f"DEBUG: Available campaigns: {list(tweet_storage.keys())}")
+        logger.debug("Update status - looking for campaign '%s'", campaign_batch)
         
         # Try database FIRST
         if update_tweet_status(campaign_batch, tweet_id, new_status):
-            return jsonify({
+            return _ojson({
                 'status': 'success',
                 'message': f'Tweet status updated to {new_status} (database)'
             })
         
         # Fallback to in-memory storage only if database fails
         elif campaign_batch in tweet_storage:
-            campaign_data = tweet_storage[campaign_batch]
-            for tweet in campaign_data.get('tweets', []):
-                if tweet['id'] == tweet_id:
-                    tweet['status'] = new_status
-                    tweet['last_modified'] = datetime.now().isoformat()
-                    break
+            tweet = _find_tweet(tweet_storage[campaign_batch], tweet_id)
+            if tweet:
+                tweet['status'] = new_status
+                tweet['last_modified'] = _now()
             
-            return jsonify({
+            return _ojson({
                 'status': 'warning',
                 'message': f'Tweet status updated to {new_status} (memory fallback - database issue)'
             })
         else:
-            return jsonify({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found anywhere. Available: {list(tweet_storage.keys())}'}), 404
+            return _ojson({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found anywhere. Available: {list(tweet_storage.keys())}'}, 404)
             
+    except orjson.JSONDecodeError:
+        return _ojson(_ERR_BAD_JSON, 400)
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return _ojson({'status': 'error', 'message': str(e)}, 500)
+
+def _upload_is_array(stream):
+    """Peek at the first non-whitespace byte of an upload and rewind"""
+    first = b''
+    while not first:
+        chunk = stream.read(64)
+        if not chunk:
+            break
+        first = chunk.lstrip()[:1]
+    stream.seek(0)
+    return first == b'['
+
+# Campaigns from an array upload saved per database transaction
+_UPLOAD_SAVE_BATCH = 50
+
+def _save_upload_batch(campaigns):
+    """Save uploaded campaigns in one transaction and describe the outcome of each"""
+    results = []
+    for campaign_data, saved in zip(campaigns, save_campaigns_bulk(campaigns)):
+        if saved:
+            logger.debug("Successfully saved to database: %s", campaign_data['campaign_batch'])
+            status = 'saved to database'
+        else:
+            logger.debug("Database save failed for %s - likely ID conflict", campaign_data['campaign_batch'])
+            status = 'CONFLICT: Campaign or tweet IDs already exist in database'
+        results.append({
+            'campaign_batch': campaign_data['campaign_batch'],
+            'tweet_count': campaign_data['tweet_count'],
+            'status': status
+        })
+    return results
 
 @app.route('/api/upload-json', methods=['POST'])
 def upload_json():
@@ -417,76 +883,70 @@ def upload_json():
         if not file.filename.endswith('.json'):
             return jsonify({'status': 'error', 'message': 'File must be a JSON file'}), 400
         
-        # Read and parse JSON file
-        json_data = json.loads(file.read().decode('utf-8'))
-        
         # Process the uploaded JSON data
         processed_campaigns = []
         
-        # Handle array format (like mock_data.json)
-        if isinstance(json_data, list):
-            print(f"DEBUG: Processing array with {len(json_data)} items")
-            for i, item in enumerate(json_data):
-                print(f"DEBUG: Item {i} keys: {item.keys() if isinstance(item, dict) else 'Not a dict'}")
+        # Handle array format (like mock_data.json) - streamed one campaign at a time
+        if _upload_is_array(file.stream):
+            logger.debug("Streaming array upload")
+            pending = []
+            for i, item in enumerate(ijson.items(file.stream, 'item', use_float=True)):
+                logger.debug("Item %s keys: %s", i, item.keys() if isinstance(item, dict) else 'Not a dict')
                 
                 # Look for campaign data in different formats
                 if 'campaign_batch' in item and 'tweets' in item:
                     # Direct campaign format
                     campaign_data = item
-                    print(f"DEBUG: Found direct campaign format: {campaign_data['campaign_batch']}")
+                    logger.debug("Found direct campaign format: %s", campaign_data['campaign_batch'])
                 elif 'processed_tweets' in item:
                     # Format with processed_tweets array - add unique naming
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = _now_stamp()
                     tweet_count = len(item.get('processed_tweets', []))
                     campaign_batch = item.get('campaign_batch', f'uploaded_{timestamp}_{tweet_count}tweets')
                     
                     campaign_data = {
                         'campaign_batch': campaign_batch,
-                        'generated_at': item.get('generated_at', datetime.now().isoformat()),
+                        'generated_at': item.get('generated_at', _now()),
                         'tweet_count': tweet_count,
                         'title': f'JSON Upload - {tweet_count} tweets',
-                        'description': f'Uploaded on {datetime.now().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets',
+                        'description': f'Uploaded on {_now_dt().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets',
                         'source_type': 'json_upload',
                         'analysis_summary': item.get('analysis_summary', {}),
                         'tweets': item.get('processed_tweets', [])
                     }
-                    print(f"DEBUG: Created campaign from processed_tweets: {campaign_data['campaign_batch']}")
+                    logger.debug("Created campaign from processed_tweets: %s", campaign_data['campaign_batch'])
                 else:
                     # Skip non-campaign items
-                    print(f"DEBUG: Skipping item {i} - no campaign data found")
+                    logger.debug("Skipping item %s - no campaign data found", i)
                     continue
                 
-                # Try to save to database FIRST
-                if save_campaign_data(campaign_data):
-                    print(f"DEBUG: Successfully saved to database: {campaign_data['campaign_batch']}")
-                    processed_campaigns.append({
-                        'campaign_batch': campaign_data['campaign_batch'],
-                        'tweet_count': campaign_data['tweet_count'],
-                        'status': 'saved to database'
-                    })
-                else:
-                    print(f"DEBUG: Database save failed for {campaign_data['campaign_batch']} - likely ID conflict")
-                    processed_campaigns.append({
-                        'campaign_batch': campaign_data['campaign_batch'],
-                        'tweet_count': campaign_data['tweet_count'],
-                        'status': 'CONFLICT: Campaign or tweet IDs already exist in database'
-                    })
+                # Saved to the database in batches, one transaction per batch
+                pending.append(campaign_data)
+                if len(pending) >= _UPLOAD_SAVE_BATCH:
+                    processed_campaigns.extend(_save_upload_batch(pending))
+                    pending = []
+            
+            if pending:
+                processed_campaigns.extend(_save_upload_batch(pending))
         
         # Handle single object format
-        elif isinstance(json_data, dict):
+        else:
+            json_data = orjson.loads(file.read())
+            if not isinstance(json_data, dict):
+                return _ojson(_ERR_BAD_JSON, 400)
             if 'tweets' in json_data:
                 campaign_data = json_data
             elif 'processed_tweets' in json_data:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = _now_stamp()
                 tweet_count = len(json_data.get('processed_tweets', []))
                 campaign_batch = json_data.get('campaign_batch', f'uploaded_{timestamp}_{tweet_count}tweets')
                 
                 campaign_data = {
                     'campaign_batch': campaign_batch,
-                    'generated_at': json_data.get('generated_at', datetime.now().isoformat()),
+                    'generated_at': json_data.get('generated_at', _now()),
                     'tweet_count': tweet_count,
                     'title': f'JSON Upload - {tweet_count} tweets',
-                    'description': f'Single JSON upload on {datetime.now().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets',
+                    'description': f'Single JSON upload on {_now_dt().strftime("%B %d, %Y at %H:%M:%S")} containing {tweet_count} tweets',
                     'source_type': 'json_upload',
                     'analysis_summary': json_data.get('analysis_summary', {}),
                     'tweets': json_data.get('processed_tweets', [])
@@ -515,31 +975,40 @@ def upload_json():
             'campaigns': processed_campaigns
         })
         
-    except json.JSONDecodeError:
-        return jsonify({'status': 'error', 'message': 'Invalid JSON format'}), 400
+    except (orjson.JSONDecodeError, ijson.JSONError):
+        # Batches committed before the parse error stay saved - report them instead of a bare 400
+        if processed_campaigns:
+            return jsonify({
+                'status': 'partial',
+                'message': f'Invalid JSON format after {len(processed_campaigns)} campaign(s) - those campaigns were processed, the rest of the file was not',
+                'campaigns': processed_campaigns
+            })
+        return _ojson(_ERR_BAD_JSON, 400)
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-@app.route('/api/campaigns', methods=['GET'])
-def list_campaigns():
-    """List all available campaigns"""
-    try:
-        campaigns = []
-        
-        # Get campaigns from database
+def _campaign_summaries():
+    """Campaign summaries with status counts - database first, memory-only campaigns appended"""
+    campaigns = []
+    
+    # Get campaigns from database (skipped while backing off from a recent failure)
+    if _db_available():
+        session = get_session()
         try:
-            from database import get_session, Campaign, Tweet
-            session = get_session()
-            db_campaigns = session.query(Campaign).all()
+            db_campaigns = session.query(Campaign).order_by(Campaign.generated_at.desc()).all()
+        
+            # Tweet status summary for every campaign in one GROUP BY query
+            counts_by_batch = {}
+            status_rows = session.query(Tweet.campaign_batch, Tweet.status, func.count()).group_by(Tweet.campaign_batch, Tweet.status).all()
+            for batch, status, count in status_rows:
+                batch_counts = counts_by_batch.setdefault(batch, {})
+                status = status or 'Draft'
+                batch_counts[status] = batch_counts.get(status, 0) + count
+        
             for campaign in db_campaigns:
-                # Get tweet status summary for this campaign
-                tweet_statuses = session.query(Tweet.status).filter(Tweet.campaign_batch == campaign.campaign_batch).all()
-                status_counts = {}
-                for status_tuple in tweet_statuses:
-                    status = status_tuple[0] or 'Draft'
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                print(f"DEBUG: Campaign {campaign.campaign_batch} status counts: {status_counts}")
-                
+                status_counts = counts_by_batch.get(campaign.campaign_batch, {})
+                logger.debug("Campaign %s status counts: %s", campaign.campaign_batch, status_counts)
+            
                 campaigns.append({
                     'campaign_batch': campaign.campaign_batch,
                     'tweet_count': campaign.tweet_count,
@@ -551,101 +1020,99 @@ def list_campaigns():
                     'source': 'database',
                     'status_counts': status_counts
                 })
+        except SQLAlchemyError as e:
+            _mark_db_down(e)
+        finally:
             session.close()
-        except Exception as e:
-            print(f"DEBUG: Database query failed: {e}")
-            pass  # Database not available
-        
-        # Get campaigns from in-memory storage ONLY as fallback (should be minimal)
-        for batch_id, campaign_data in tweet_storage.items():
-            # Only add if not already in database results
-            if not any(c['campaign_batch'] == batch_id for c in campaigns):
-                # Calculate status counts for memory campaigns
-                status_counts = {}
-                tweets = campaign_data.get('tweets', [])
-                for tweet in tweets:
-                    status = tweet.get('status', 'Draft')
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                
-                campaigns.append({
-                    'campaign_batch': batch_id,
-                    'tweet_count': campaign_data.get('tweet_count', len(tweets)),
-                    'generated_at': campaign_data.get('generated_at', 'Unknown'),
-                    'title': campaign_data.get('title', f'Campaign {batch_id}'),
-                    'description': campaign_data.get('description', 'Memory fallback campaign'),
-                    'source_type': campaign_data.get('source_type', 'unknown'),
-                    'source': 'memory (emergency fallback)',
-                    'status_counts': status_counts
-                })
-                print(f"DEBUG: Added memory fallback campaign: {batch_id}")
-        
-        # Sort campaigns by generated_at in reverse chronological order (newest first)
+    
+    # Get campaigns from in-memory storage ONLY as fallback (should be minimal)
+    db_batches = {c['campaign_batch'] for c in campaigns}
+    for batch_id, campaign_data in tweet_storage.items():
+        # Only add if not already in database results
+        if batch_id not in db_batches:
+            # Calculate status counts for memory campaigns
+            status_counts = {}
+            tweets = campaign_data.get('tweets') or ()
+            for tweet in tweets:
+                status = tweet.get('status', 'Draft')
+                status_counts[status] = status_counts.get(status, 0) + 1
+            
+            campaigns.append({
+                'campaign_batch': batch_id,
+                'tweet_count': campaign_data.get('tweet_count', len(tweets)),
+                'generated_at': campaign_data.get('generated_at', 'Unknown'),
+                'title': campaign_data.get('title', f'Campaign {batch_id}'),
+                'description': campaign_data.get('description', 'Memory fallback campaign'),
+                'source_type': campaign_data.get('source_type', 'unknown'),
+                'source': 'memory (emergency fallback)',
+                'status_counts': status_counts
+            })
+            logger.debug("Added memory fallback campaign: %s", batch_id)
+    
+    # Database rows arrive newest first; only re-sort when memory campaigns were mixed in
+    if len(campaigns) > len(db_batches):
         campaigns.sort(key=lambda x: x.get('generated_at', ''), reverse=True)
+    
+    return campaigns
+
+# Seconds a serialized campaign listing is reused between writes (the sidebar polls it)
+_CAMPAIGNS_CACHE_TTL = 5
+
+@app.route('/api/campaigns', methods=['GET'])
+def list_campaigns():
+    """List all available campaigns"""
+    try:
+        def build():
+            campaigns = _campaign_summaries()
+            return {
+                'status': 'success',
+                'campaigns': campaigns,
+                'total': len(campaigns)
+            }
         
-        return jsonify({
-            'status': 'success',
-            'campaigns': campaigns,
-            'total': len(campaigns)
-        })
+        # Pollers get a 304 when nothing in the listing changed
+        return _cached_json('campaigns', _CAMPAIGNS_CACHE_TTL, build, conditional=True)
         
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# Page size of the status listing when the client gives none, and the largest it may request
+_STATUS_PAGE_DEFAULT = 100
+_STATUS_PAGE_MAX = 500
+
 @app.route('/api/tweets-by-status/<status>')
 def get_tweets_by_status(status):
-    """Get all tweets with a specific status"""
+    """Get one page of tweets with a specific status (?limit=, default 100; follow next_cursor via ?cursor=)"""
     try:
-        tweets_by_status = []
-        
-        # Search through all campaigns in memory
-        for campaign_batch, campaign_data in tweet_storage.items():
-            for tweet in campaign_data.get('tweets', []):
-                tweet_status = tweet.get('status', 'Draft')
-                print(f"DEBUG: Checking tweet {tweet.get('id')} with status '{tweet_status}' against filter '{status}'")
-                if tweet_status.lower() == status.lower():
-                    tweet_with_campaign = tweet.copy()
-                    tweet_with_campaign['campaign_batch'] = campaign_batch
-                    tweets_by_status.append(tweet_with_campaign)
-                    print(f"DEBUG: Added tweet {tweet.get('id')} to results")
-        
-        # Also search database if available
-        try:
-            from database import get_session, Tweet
-            session = get_session()
-            db_tweets = session.query(Tweet).filter(Tweet.status.ilike(f'%{status}%')).all()
-            for db_tweet in db_tweets:
-                tweet_dict = {
-                    'id': db_tweet.id,
-                    'campaign_batch': db_tweet.campaign_batch,
-                    'type': db_tweet.type,
-                    'content': db_tweet.content,
-                    'character_count': db_tweet.character_count,
-                    'status': db_tweet.status,
-                    'engagement_hook': db_tweet.engagement_hook,
-                    'last_modified': db_tweet.last_modified.isoformat() if db_tweet.last_modified else None,
-                    'posted_date': db_tweet.posted_date.isoformat() if db_tweet.posted_date else None
-                }
-                tweets_by_status.append(tweet_dict)
-            session.close()
-        except:
-            pass  # Database not available
-        
-        # Remove duplicates based on tweet id
-        seen_ids = set()
-        unique_tweets = []
-        for tweet in tweets_by_status:
-            if tweet['id'] not in seen_ids:
-                unique_tweets.append(tweet)
-                seen_ids.add(tweet['id'])
-        
-        # Sort by last_modified (newest first)
-        unique_tweets.sort(key=lambda x: x.get('last_modified', ''), reverse=True)
+        limit = max(1, min(request.args.get('limit', _STATUS_PAGE_DEFAULT, type=int), _STATUS_PAGE_MAX))
+        cursor = request.args.get('cursor')
+        # A mangled cursor must not silently restart the listing at the first page
+        if cursor and decode_keyset_cursor(cursor) is None:
+            return _ojson(_ERR_BAD_CURSOR, 400)
+        
+        # Filter, order and page in the database (served by the lower(status), last_modified index)
+        result = get_status_tweets_page(status, limit=limit, cursor=cursor)
+        if result is not None:
+            tweets_by_status, next_cursor = result
+        else:
+            # Database not available - fall back to scanning the in-memory campaigns
+            status_key = status.lower()
+            matches = {}  # tweet id -> tweet; the first campaign holding an id wins
+            for campaign_batch, campaign_data in tweet_storage.items():
+                for tweet in campaign_data.get('tweets') or ():
+                    if tweet['id'] not in matches and tweet.get('status', 'Draft').lower() == status_key:
+                        matches[tweet['id']] = {**tweet, 'campaign_batch': campaign_batch}
+            
+            # Sort by last_modified (newest first)
+            tweets_by_status = sorted(matches.values(), key=lambda x: x.get('last_modified', ''), reverse=True)
+            next_cursor = None
         
         return jsonify({
             'status': 'success',
-            'tweets': unique_tweets,
-            'total': len(unique_tweets),
-            'filter_status': status
+            'tweets': tweets_by_status,
+            'total': len(tweets_by_status),
+            'filter_status': status,
+            'next_cursor': next_cursor
         })
         
     except Exception as e:
@@ -655,41 +1122,36 @@ def get_tweets_by_status(status):
 def delete_tweet():
     """Delete a tweet"""
     try:
-        data = request.get_json()
+        data = _request_json()
         campaign_batch = data.get('campaign_batch')
         tweet_id = data.get('tweet_id')
         
-        print(f"DEBUG: Delete tweet - campaign '{campaign_batch}', tweet '{tweet_id}'")
-        print(f"DEBUG: Available campaigns: {list(tweet_storage.keys())}")
+        logger.debug("Delete tweet - campaign '%s', tweet '%s'", campaign_batch, tweet_id)
         
         # Try database first, then memory fallback
         success = False
         
         # Try to update in database first
         if update_tweet_status(campaign_batch, tweet_id, 'Deleted'):
-            print(f"DEBUG: Marked tweet '{tweet_id}' as deleted in database")
+            logger.debug("Marked tweet '%s' as deleted in database", tweet_id)
             success = True
         
         # Check in-memory storage as fallback
         if not success and campaign_batch in tweet_storage:
-            campaign_data = tweet_storage[campaign_batch]
-            tweets = campaign_data.get('tweets', [])
-            
             # Find and mark tweet as deleted instead of removing it
-            for tweet in tweets:
-                if tweet['id'] == tweet_id:
-                    # Check if already deleted
-                    if tweet.get('status') == 'Deleted':
-                        return jsonify({
-                            'status': 'error',
-                            'message': f'Tweet "{tweet.get("content", "")[:50]}..." is already deleted'
-                        }), 400
-                    
-                    tweet['status'] = 'Deleted'
-                    tweet['deleted_at'] = datetime.now().isoformat()
-                    print(f"DEBUG: Marked tweet '{tweet_id}' as deleted in memory")
-                    success = True
-                    break
+            tweet = _find_tweet(tweet_storage[campaign_batch], tweet_id)
+            if tweet:
+                # Check if already deleted
+                if tweet.get('status') == 'Deleted':
+                    return jsonify({
+                        'status': 'error',
+                        'message': f'Tweet "{tweet.get("content", "")[:50]}..." is already deleted'
+                    }), 400
+                
+                tweet['status'] = 'Deleted'
+                tweet['deleted_at'] = _now()
+                logger.debug("Marked tweet '%s' as deleted in memory", tweet_id)
+                success = True
         
         if success:
             return jsonify({
@@ -707,14 +1169,14 @@ def delete_tweet():
 def delete_campaign():
     """Delete an entire campaign and all associated tweets"""
     try:
-        data = request.get_json()
+        data = _request_json()
         campaign_batch = data.get('campaign_batch')
         hard_delete = data.get('hard_delete', False)  # Default to soft delete
         
         if not campaign_batch:
-            return jsonify({'status': 'error', 'message': 'campaign_batch is required'}), 400
+            return _ojson(_ERR_BATCH_REQUIRED, 400)
         
-        print(f"DEBUG: Delete campaign request - batch: '{campaign_batch}', hard_delete: {hard_delete}")
+        logger.debug("Delete campaign request - batch: '%s', hard_delete: %s", campaign_batch, hard_delete)
         
         # Use the new cascade delete function from database.py
         success, message, deleted_count = delete_campaign_cascade(campaign_batch, hard_delete)
@@ -723,7 +1185,7 @@ def delete_campaign():
             # Also remove from in-memory storage if present (fallback mode)
             if campaign_batch in tweet_storage:
                 del tweet_storage[campaign_batch]
-                print(f"DEBUG: Also removed campaign '{campaign_batch}' from memory storage")
+                logger.debug("Also removed campaign '%s' from memory storage", campaign_batch)
             
             return jsonify({
                 'status': 'success',
@@ -739,64 +1201,52 @@ def delete_campaign():
             }), 404
             
     except Exception as e:
-        print(f"DEBUG: Delete campaign error: {e}")
+        logger.warning("Delete campaign error: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/update-campaign-name', methods=['POST'])
 def update_campaign_name():
     """Update campaign display name"""
     try:
-        data = request.get_json()
+        data = _request_json()
         campaign_batch = data.get('campaign_batch')
         display_name = data.get('display_name', '')
         
         if not campaign_batch:
-            return jsonify({'status': 'error', 'message': 'campaign_batch is required'}), 400
+            return _ojson(_ERR_BATCH_REQUIRED, 400)
         
-        print(f"DEBUG: Update campaign name - batch: '{campaign_batch}', name: '{display_name}'")
+        logger.debug("Update campaign name - batch: '%s', name: '%s'", campaign_batch, display_name)
         
-        # Update in database
-        from database import get_session, Campaign
-        session = get_session()
-        try:
-            campaign = session.query(Campaign).filter_by(campaign_batch=campaign_batch).first()
-            if not campaign:
-                return jsonify({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found'}), 404
-            
-            campaign.display_name = display_name
-            campaign.updated_at = datetime.utcnow()
-            session.commit()
-            
-            print(f"DEBUG: Successfully updated campaign name: '{display_name}'")
-            return jsonify({
-                'status': 'success',
-                'message': f'Campaign name updated to "{display_name}"',
-                'campaign_batch': campaign_batch,
-                'display_name': display_name
-            })
-            
-        except Exception as e:
-            session.rollback()
-            print(f"DEBUG: Database update error: {e}")
-            return jsonify({'status': 'error', 'message': f'Database error: {str(e)}'}), 500
-        finally:
-            session.close()
+        # Update in database (serialized with the other writes)
+        updated = update_campaign_display_name(campaign_batch, display_name)
+        if updated is None:
+            return jsonify({'status': 'error', 'message': 'Database error updating campaign name'}), 500
+        if not updated:
+            return jsonify({'status': 'error', 'message': f'Campaign "{campaign_batch}" not found'}), 404
+        
+        logger.debug("Successfully updated campaign name: '%s'", display_name)
+        return jsonify({
+            'status': 'success',
+            'message': f'Campaign name updated to "{display_name}"',
+            'campaign_batch': campaign_batch,
+            'display_name': display_name
+        })
             
     except Exception as e:
-        print(f"DEBUG: Update campaign name error: {e}")
+        logger.warning("Update campaign name error: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/bulk-delete-scraped-tweets', methods=['POST'])
 def bulk_delete_scraped_tweets_endpoint():
     """Bulk delete scraped tweets"""
     try:
-        data = request.get_json()
+        data = _request_json()
         tweet_ids = data.get('tweet_ids', [])
         
         if not tweet_ids:
             return jsonify({'status': 'error', 'message': 'tweet_ids is required'}), 400
         
-        print(f"DEBUG: Bulk delete scraped tweets - {len(tweet_ids)} tweets")
+        logger.debug("Bulk delete scraped tweets - %s tweets", len(tweet_ids))
         
         # Use the bulk delete function from database.py
         success, message, deleted_count = bulk_delete_scraped_tweets(tweet_ids)
@@ -815,119 +1265,133 @@ def bulk_delete_scraped_tweets_endpoint():
             }), 404
             
     except Exception as e:
-        print(f"DEBUG: Bulk delete scraped tweets error: {e}")
+        logger.warning("Bulk delete scraped tweets error: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# After a failed database query the memory fallback is served for this many seconds instead of
+# paying a connection attempt (and traceback) on every request
+_DB_RETRY_AFTER = 30
+_db_down_until = 0.0
+
+def _db_available():
+    """False while a recent database failure is being backed off from"""
+    return time.monotonic() >= _db_down_until
+
+def _mark_db_down(error):
+    """Record a database failure and start the back-off window"""
+    global _db_down_until
+    _db_down_until = time.monotonic() + _DB_RETRY_AFTER
+    logger.warning("Database query failed, using memory storage for %ss: %s", _DB_RETRY_AFTER, error)
+
+def _collect_all_tweets():
+    """All tweets sorted newest campaign first - from the database, or from memory when it is unavailable"""
+    tweets = None
+    if _db_available():
+        try:
+            tweets = list(iter_all_tweets())
+        except SQLAlchemyError as e:
+            _mark_db_down(e)
+    
+    if tweets is None:
+        # Database not available - fall back to the in-memory campaigns (first campaign holding an id wins)
+        unique = {}  # tweet id -> tweet
+        for campaign_batch, campaign_data in tweet_storage.items():
+            generated_at = campaign_data.get('generated_at') or ''
+            for tweet in campaign_data.get('tweets') or ():
+                if tweet['id'] not in unique:
+                    unique[tweet['id']] = {**tweet, 'campaign_batch': campaign_batch, 'generated_at': generated_at}
+        
+        # Sort by generated_at, then by campaign_batch (database rows already arrive in this order)
+        tweets = sorted(unique.values(), key=itemgetter('generated_at', 'campaign_batch'), reverse=True)
+    
+    return tweets
+
+# Seconds a serialized all-tweets listing is reused between writes
+_ALL_TWEETS_CACHE_TTL = 10
+
 @app.route('/api/all-tweets')
 def get_all_tweets():
     """Get all tweets from all campaigns"""
     try:
-        all_tweets = []
-        
-        # Get tweets from memory
-        for campaign_batch, campaign_data in tweet_storage.items():
-            for tweet in campaign_data.get('tweets', []):
-                tweet_with_campaign = tweet.copy()
-                tweet_with_campaign['campaign_batch'] = campaign_batch
-                tweet_with_campaign['generated_at'] = campaign_data.get('generated_at', '')
-                all_tweets.append(tweet_with_campaign)
-        
-        # Also get from database if available
-        try:
-            from database import get_session, Tweet
-            session = get_session()
-            db_tweets = session.query(Tweet).all()
-            for db_tweet in db_tweets:
-                tweet_dict = {
-                    'id': db_tweet.id,
-                    'campaign_batch': db_tweet.campaign_batch,
-                    'type': db_tweet.type,
-                    'content': db_tweet.content,
-                    'character_count': db_tweet.character_count,
-                    'status': db_tweet.status,
-                    'engagement_hook': db_tweet.engagement_hook,
-                    'last_modified': db_tweet.last_modified.isoformat() if db_tweet.last_modified else None,
-                    'posted_date': db_tweet.posted_date.isoformat() if db_tweet.posted_date else None,
-                    'generated_at': '',
-                    'deleted_at': getattr(db_tweet, 'deleted_at', None)
-                }
-                all_tweets.append(tweet_dict)
-            session.close()
-        except:
-            pass  # Database not available
-        
-        # Remove duplicates
-        seen_ids = set()
-        unique_tweets = []
-        for tweet in all_tweets:
-            if tweet['id'] not in seen_ids:
-                unique_tweets.append(tweet)
-                seen_ids.add(tweet['id'])
-        
-        # Sort by generated_at, then by campaign_batch
-        unique_tweets.sort(key=lambda x: (x.get('generated_at', ''), x.get('campaign_batch', '')), reverse=True)
+        def build():
+            unique_tweets = _collect_all_tweets()
+            return {
+                'status': 'success',
+                'tweets': unique_tweets,
+                'total': len(unique_tweets)
+            }
         
-        return jsonify({
-            'status': 'success',
-            'tweets': unique_tweets,
-            'total': len(unique_tweets)
-        })
+        return _cached_json('all_tweets', _ALL_TWEETS_CACHE_TTL, build)
         
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+_CSV_CHUNK_ROWS = 1000
+
+def _csv_chunks(header, rows):
+    """Yield CSV text in chunks of _CSV_CHUNK_ROWS rows, formatted by writer.writerows in C"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    rows = iter(rows)
+    while True:
+        writer.writerows(islice(rows, _CSV_CHUNK_ROWS))
+        chunk = buffer.getvalue()
+        if not chunk:
+            return
+        yield chunk
+        buffer.seek(0)
+        buffer.truncate()
+
+def _csv_layout(columns):
+    """Precompute (header row, per-key defaults, row getter) from (header, key, default) columns"""
+    defaults = {key: default for _, key, default in columns}
+    return tuple(column[0] for column in columns), defaults, itemgetter(*defaults)
+
+# Export columns as (header, tweet key, default when the key is missing), laid out once at import
+_TWEET_CSV = _csv_layout((
+    ('Tweet_ID', 'id', ''), ('Campaign_Batch', 'campaign_batch', ''), ('Generated_Date', 'generated_at', ''),
+    ('Content', 'content', ''), ('Character_Count', 'character_count', ''), ('Tweet_Type', 'type', ''),
+    ('Status', 'status', 'Draft'), ('Engagement_Hook', 'engagement_hook', ''), ('Last_Modified', 'last_modified', ''),
+    ('Posted_Date', 'posted_date', ''), ('Deleted_At', 'deleted_at', ''), ('Notes', 'notes', ''),
+))
+_SCRAPED_CSV = _csv_layout((
+    ('Tweet_ID', 'Tweet ID', ''), ('URL', 'URL', ''), ('Content', 'Content', ''), ('Date', 'Date', ''),
+    ('Likes', 'Likes', 0), ('Retweets', 'Retweets', 0), ('Replies', 'Replies', 0), ('Quotes', 'Quotes', 0),
+    ('Views', 'Views', 0), ('Status', 'Status', ''), ('Tweet_URL', 'Tweet', ''), ('Execution_ID', 'execution_id', ''),
+    ('Source_URL', 'source_url', ''), ('Created_At', 'created_at', ''), ('Engagement_Total', 'engagement_total', 0),
+))
+
+def _csv_response(header, rows, filename):
+    """Stream row tuples as a CSV download"""
+    return Response(_csv_chunks(header, rows), mimetype='text/csv', headers={
+        'Content-Disposition': f'attachment; filename={filename}'
+    })
+
+def _csv_rows(layout, records):
+    """Row tuples for record dicts using a layout from _csv_layout"""
+    _, defaults, getter = layout
+    return (getter({**defaults, **record}) for record in records)
+
+def _all_tweet_csv_rows():
+    """CSV rows for every tweet - tuples straight from the database in batches, or the memory fallback"""
+    if _db_available():
+        rows = iter_all_tweet_csv_rows()
+        try:
+            # Pull the first batch now so an unavailable database still falls back to memory
+            first = next(rows, None)
+        except SQLAlchemyError as e:
+            _mark_db_down(e)
+        else:
+            return rows if first is None else chain((first,), rows)
+    return _csv_rows(_TWEET_CSV, _collect_all_tweets())
+
 @app.route('/api/export-csv')
 def export_tweets_csv():
     """Export all tweets as CSV"""
     try:
-        # Get all tweets
-        response = get_all_tweets()
-        data = response.get_json()
-        
-        if data['status'] != 'success':
-            return jsonify({'status': 'error', 'message': 'Failed to get tweets'}), 500
-        
-        tweets = data['tweets']
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        headers = [
-            'Tweet_ID', 'Campaign_Batch', 'Generated_Date', 'Content', 
-            'Character_Count', 'Tweet_Type', 'Status', 'Engagement_Hook',
-            'Last_Modified', 'Posted_Date', 'Deleted_At', 'Notes'
-        ]
-        writer.writerow(headers)
-        
-        # Write data
-        for tweet in tweets:
-            row = [
-                tweet.get('id', ''),
-                tweet.get('campaign_batch', ''),
-                tweet.get('generated_at', ''),
-                tweet.get('content', ''),
-                tweet.get('character_count', ''),
-                tweet.get('type', ''),
-                tweet.get('status', 'Draft'),
-                tweet.get('engagement_hook', ''),
-                tweet.get('last_modified', ''),
-                tweet.get('posted_date', ''),
-                tweet.get('deleted_at', ''),
-                tweet.get('notes', '')
-            ]
-            writer.writerow(row)
-        
-        # Create response
-        csv_content = output.getvalue()
-        output.close()
-        
-        response = make_response(csv_content)
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=all_tweets_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        
-        return response
+        # Rows are written to the client in chunks as they are produced instead of buffered into one string
+        return _csv_response(_TWEET_CSV[0], _all_tweet_csv_rows(), f'all_tweets_{_now_stamp()}.csv')
             
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -936,54 +1400,18 @@ def export_tweets_csv():
 def export_scraped_tweets_csv():
     """Export scraped tweets as CSV"""
     try:
-        # Get all scraped tweets (no pagination for export)
-        tweets_data, total_count = get_scraped_tweets()
+        # Stream all scraped tweets from the database in batches (no pagination for export)
+        tweets = iter_scraped_tweets()
+        try:
+            first = next(tweets, None)
+        except SQLAlchemyError as e:
+            logger.warning("Database error exporting scraped tweets: %s", e)
+            first = None
         
-        if not tweets_data:
+        if first is None:
             return jsonify({'status': 'error', 'message': 'No scraped tweets found'}), 404
         
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        headers = [
-            'Tweet_ID', 'URL', 'Content', 'Date', 'Likes', 'Retweets', 
-            'Replies', 'Quotes', 'Views', 'Status', 'Tweet_URL', 
-            'Execution_ID', 'Source_URL', 'Created_At', 'Engagement_Total'
-        ]
-        writer.writerow(headers)
-        
-        # Write data
-        for tweet in tweets_data:
-            row = [
-                tweet.get('Tweet ID', ''),
-                tweet.get('URL', ''),
-                tweet.get('Content', ''),
-                tweet.get('Date', ''),
-                tweet.get('Likes', 0),
-                tweet.get('Retweets', 0),
-                tweet.get('Replies', 0),
-                tweet.get('Quotes', 0),
-                tweet.get('Views', 0),
-                tweet.get('Status', ''),
-                tweet.get('Tweet', ''),
-                tweet.get('execution_id', ''),
-                tweet.get('source_url', ''),
-                tweet.get('created_at', ''),
-                tweet.get('engagement_total', 0)
-            ]
-            writer.writerow(row)
-        
-        # Create response
-        csv_content = output.getvalue()
-        output.close()
-        
-        response = make_response(csv_content)
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=scraped_tweets_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        
-        return response
+        return _csv_response(_SCRAPED_CSV[0], _csv_rows(_SCRAPED_CSV, chain((first,), tweets)), f'scraped_tweets_{_now_stamp()}.csv')
             
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -1012,7 +1440,7 @@ def check_duplicate_tweet():
     """
     try:
         # Get request data
-        raw_data = request.get_json()
+        raw_data = _request_json()
         if not raw_data:
             return jsonify({'status': 'error', 'message': 'No JSON data provided'}), 400
         
@@ -1026,7 +1454,7 @@ def check_duplicate_tweet():
         
         execution_id = data.get('execution_id')
         source_url = data.get('source_url')
-        tweets = data.get('tweets', [])
+        tweets = data.get('tweets')
         
         # Validation
         if not execution_id:
@@ -1044,31 +1472,33 @@ def check_duplicate_tweet():
             else:
                 return jsonify({'status': 'error', 'message': f'Tweet missing "Tweet ID" field: {tweet}'}), 400
         
-        print(f"DEBUG: Duplicate check request - execution_id: {execution_id}, tweet_count: {len(tweets)}")
+        logger.debug("Duplicate check request - execution_id: %s, tweet_count: %s", execution_id, len(tweets))
         
         # Check for duplicates using IMPROVED LOGIC (execution_id first, then Tweet ID)
         existing_ids, new_ids = check_duplicate_scraped_tweets(tweet_ids, execution_id)
         
         # Filter tweets to return only new ones
-        new_tweets = [tweet for tweet in tweets if tweet['Tweet ID'] in new_ids]
+        new_id_set = set(new_ids)
+        new_tweets = [tweet for tweet in tweets if tweet['Tweet ID'] in new_id_set]
         
         # SAVE non-duplicate tweets to database
         saved_count = 0
+        skipped_count = 0
         save_errors = []
         
         if new_tweets:
             try:
-                saved_count, error_count, errors = save_scraped_tweets(new_tweets, execution_id, source_url)
-                print(f"DEBUG: Successfully saved {saved_count} scraped tweets")
+                saved_count, error_count, errors, skipped_count = save_scraped_tweets(new_tweets, execution_id, source_url)
+                logger.debug("Successfully saved %s scraped tweets", saved_count)
                 if error_count > 0:
                     save_errors.extend(errors)
-                    print(f"DEBUG: {error_count} errors occurred during save")
+                    logger.debug("%s errors occurred during save", error_count)
             except Exception as save_error:
                 save_errors.append(str(save_error))
-                print(f"ERROR: Failed to save tweets to database: {save_error}")
+                logger.error("Failed to save tweets to database: %s", save_error)
         
         # Log the results
-        print(f"DEBUG: Duplicate check complete - {len(existing_ids)} duplicates, {len(new_tweets)} new tweets, {saved_count} saved")
+        logger.debug("Duplicate check complete - %s duplicates, %s new tweets, %s saved", len(existing_ids), len(new_tweets), saved_count)
         
         # Enhanced response with detailed information for both Web UI and n8n API
         response_status = 'success'
@@ -1093,7 +1523,7 @@ def check_duplicate_tweet():
                 'duplicates_found': len(existing_ids),
                 'new_tweets_found': len(new_tweets),
                 'saved_to_database': saved_count,
-                'execution_id_duplicates': len([tid for tid in existing_ids if execution_id]) if execution_id else 0,
+                'execution_id_duplicates': len(existing_ids) if execution_id else 0,
                 'tweet_id_duplicates': len(existing_ids)
             },
             'data': {
@@ -1105,6 +1535,7 @@ def check_duplicate_tweet():
             'debug_info': {
                 'processed_count': len(tweets),
                 'saved_count': saved_count,
+                'skipped_count': skipped_count,
                 'error_count': len(save_errors)
             }
         }
@@ -1113,12 +1544,15 @@ def check_duplicate_tweet():
             response['errors'] = save_errors
             response['message'] += f" ({len(save_errors)} save errors occurred)"
         
-        return jsonify(response)
+        return _ojson(response)
         
     except Exception as e:
-        print(f"ERROR: check_duplicate_tweet failed: {e}")
+        logger.error("check_duplicate_tweet failed: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# Fields every tweet posted to /api/store-scraped-tweets must carry
+_SCRAPED_REQUIRED_FIELDS = ['Tweet ID', 'URL', 'Content', 'Date']
+
 @app.route('/api/store-scraped-tweets', methods=['POST'])
 def store_scraped_tweets():
     """
@@ -1131,6 +1565,7 @@ def store_scraped_tweets():
     Returns: {
         "status": "success",
         "stored_count": N,
+        "skipped_count": N,
         "error_count": N,
         "errors": [...],
         "execution_id": "..."
@@ -1138,13 +1573,13 @@ def store_scraped_tweets():
     """
     try:
         # Get request data
-        data = request.get_json()
+        data = _request_json()
         if not data:
             return jsonify({'status': 'error', 'message': 'No JSON data provided'}), 400
         
         execution_id = data.get('execution_id')
         source_url = data.get('source_url')
-        tweets = data.get('tweets', [])
+        tweets = data.get('tweets')
         
         # Validation
         if not execution_id:
@@ -1154,28 +1589,31 @@ def store_scraped_tweets():
         if not tweets or not isinstance(tweets, list):
             return jsonify({'status': 'error', 'message': 'Missing or invalid tweets array'}), 400
         
-        # Validate tweet structure
+        # Validate tweet structure (single pass; the field list is only built for an invalid tweet)
         for i, tweet in enumerate(tweets):
-            required_fields = ['Tweet ID', 'URL', 'Content', 'Date']
-            missing_fields = [field for field in required_fields if not tweet.get(field)]
-            if missing_fields:
-                return jsonify({
-                    'status': 'error', 
-                    'message': f'Tweet {i+1} missing required fields: {missing_fields}'
-                }), 400
+            if all(tweet.get(field) for field in _SCRAPED_REQUIRED_FIELDS):
+                continue
+            missing_fields = [field for field in _SCRAPED_REQUIRED_FIELDS if not tweet.get(field)]
+            return jsonify({
+                'status': 'error', 
+                'message': f'Tweet {i+1} missing required fields: {missing_fields}'
+            }), 400
         
-        print(f"DEBUG: Store tweets request - execution_id: {execution_id}, tweet_count: {len(tweets)}")
+        logger.debug("Store tweets request - execution_id: %s, tweet_count: %s", execution_id, len(tweets))
         
         # Save tweets to database
-        success_count, error_count, errors = save_scraped_tweets(tweets, execution_id, source_url)
+        success_count, error_count, errors, skipped_count = save_scraped_tweets(tweets, execution_id, source_url)
         
         # Log the results
-        print(f"DEBUG: Store tweets complete - {success_count} stored, {error_count} errors")
+        logger.debug("Store tweets complete - %s stored, %s skipped, %s errors", success_count, skipped_count, error_count)
         
-        if success_count > 0:
+        if success_count > 0 or skipped_count > 0:
+            # Tweets that were already stored count as handled, so re-posting a batch is a no-op
             status_code = 200
             status = 'success'
             message = f'Successfully stored {success_count} tweets'
+            if skipped_count > 0:
+                message += f' ({skipped_count} already stored)'
             if error_count > 0:
                 message += f' ({error_count} errors)'
         else:
@@ -1187,6 +1625,7 @@ def store_scraped_tweets():
             'status': status,
             'message': message,
             'stored_count': success_count,
+            'skipped_count': skipped_count,
             'error_count': error_count,
             'errors': errors,
             'execution_id': execution_id,
@@ -1194,24 +1633,26 @@ def store_scraped_tweets():
             'processed_count': len(tweets)
         }
         
-        return jsonify(response_data), status_code
+        return _ojson(response_data, status_code)
         
     except Exception as e:
-        print(f"ERROR: store_scraped_tweets failed: {e}")
+        logger.error("store_scraped_tweets failed: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 # ============================================================================
 # DATABASE ADMIN ENDPOINTS (Phase 1 - Database Management)
 # ============================================================================
 
+# Seconds a database status report is reused between writes
+_DB_STATUS_CACHE_TTL = 30
+
 @app.route('/api/database-status', methods=['GET'])
 def get_db_status():
     """Get database status and migration information - PUBLIC ENDPOINT"""
     try:
-        status = get_database_status()
-        return jsonify({
+        return _cached_json('database_status', _DB_STATUS_CACHE_TTL, lambda: {
             'status': 'success',
-            'database': status
+            'database': get_database_status()
         })
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -1259,31 +1700,34 @@ def database_admin_page():
     """Database administration page"""
     return render_template('database_admin.html')
 
+# Sample data for demo purposes - built once at import, never mutated
+_SAMPLE_DATA = {
+    'campaign_batch': 'demo_batch',
+    'generated_at': datetime.now().isoformat(),
+    'tweet_count': 3,
+    'analysis_summary': {
+        'input_batch_size': 20,
+        'dominant_themes': ['AI/ML Technology', 'Developer Community', 'Blockchain/Web3'],
+        'content_strategy': 'Demo content strategy for CoopHive social media engagement.'
+    },
+    'tweets': [
+        {
+            'id': 'demo-tweet-1',
+            'type': 'community_engagement',
+            'content': 'This is a demo tweet showcasing CoopHive\'s decentralized compute capabilities. What\'s your biggest compute challenge?',
+            'character_count': 125,
+            'status': 'Draft',
+            'engagement_hook': 'What\'s your biggest compute challenge?',
+            'coophive_elements': ['decentralized compute', 'cost savings'],
+            'discord_voice_patterns': ['practical question'],
+            'is_edited': False
+        }
+    ]
+}
+
 def get_sample_data():
-    """Sample data for demo purposes"""
-    return {
-        'campaign_batch': 'demo_batch',
-        'generated_at': datetime.now().isoformat(),
-        'tweet_count': 3,
-        'analysis_summary': {
-            'input_batch_size': 20,
-            'dominant_themes': ['AI/ML Technology', 'Developer Community', 'Blockchain/Web3'],
-            'content_strategy': 'Demo content strategy for CoopHive social media engagement.'
-        },
-        'tweets': [
-            {
-                'id': 'demo-tweet-1',
-                'type': 'community_engagement',
-                'content': 'This is a demo tweet showcasing CoopHive\'s decentralized compute capabilities. What\'s your biggest compute challenge?',
-                'character_count': 125,
-                'status': 'Draft',
-                'engagement_hook': 'What\'s your biggest compute challenge?',
-                'coophive_elements': ['decentralized compute', 'cost savings'],
-                'discord_voice_patterns': ['practical question'],
-                'is_edited': False
-            }
-        ]
-    }
+    """Sample data for demo purposes (shared - deep copy before mutating)"""
+    return _SAMPLE_DATA
 
 if __name__ == '__main__':
     # Railway deployment configuration
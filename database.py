@@ -1,17 +1,31 @@
-from sqlalchemy import create_engine, Column, String, Text, DateTime, Integer, Boolean, JSON, inspect, text
+from sqlalchemy import create_engine, Column, String, Text, DateTime, Integer, Boolean, JSON, Index, and_, delete, event, func, insert, inspect, or_, text, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime, timezone
+import base64
+import binascii
+import functools
+import logging
+import orjson
 import os
-import json
+import threading
+import time
+
+# Child of the app's 'xbot' logger, so records share its queue handler and LOG_LEVEL
+logger = logging.getLogger('xbot.database')
 
 Base = declarative_base()
 
 # Database version for migration tracking
-CURRENT_DB_VERSION = 3
+CURRENT_DB_VERSION = 9
 
 # Global engine and session factory for connection reuse
 _engine = None
+_session_factory = None  # plain sessions for the functions below, built once per engine
 _Session = None
 
 class DatabaseVersion(Base):
@@ -53,6 +67,15 @@ class Tweet(Base):
     last_modified = Column(DateTime, default=datetime.utcnow)
     posted_date = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Case-insensitive status filter plus newest-first keyset order used by the status pages
+        Index('ix_tweets_status_lower_last_modified', func.lower(status), 'last_modified', 'id'),
+        # Per-campaign status counts (GROUP BY campaign_batch, status) straight from the index
+        Index('ix_tweets_campaign_batch_status', 'campaign_batch', 'status'),
+        # Campaign tweet lookups and the (campaign_batch DESC, id) keyset order of the all-tweets export
+        Index('ix_tweets_campaign_batch_id', 'campaign_batch', 'id'),
+    )
 
 class ScrapedTweet(Base):
     __tablename__ = 'scraped_tweets'
@@ -72,6 +95,13 @@ class ScrapedTweet(Base):
     source_url = Column(String(200))                 # N8N source URL
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Keyset pagination order for the scraped tweets page
+        Index('ix_scraped_tweets_date_tweet_id', 'date', 'tweet_id'),
+        # Same-execution duplicate checks and execution_id filters
+        Index('ix_scraped_tweets_execution_id', 'execution_id'),
+    )
 
 def get_database_url():
     """Get database URL from environment or use SQLite for local development"""
@@ -96,8 +126,7 @@ def get_database_version():
     if 'database_version' not in inspector.get_table_names():
         return 0
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
         version_record = session.query(DatabaseVersion).first()
         if version_record:
@@ -114,29 +143,28 @@ def set_database_version(version, notes=""):
     if _engine is None:
         return False
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        # Delete existing version records
-        session.query(DatabaseVersion).delete()
-        
-        # Create new version record
-        version_record = DatabaseVersion(
-            version=version,
-            updated_at=datetime.utcnow(),
-            migration_notes=notes
-        )
-        session.add(version_record)
+        # Update the single version record in place; only a new database needs an insert
+        values = {'version': version, 'updated_at': datetime.utcnow(), 'migration_notes': notes}
+        if session.execute(update(DatabaseVersion).values(**values)).rowcount == 0:
+            session.add(DatabaseVersion(**values))
         session.commit()
-        print(f"DEBUG: Database version set to {version}: {notes}")
+        logger.debug("Database version set to %s: %s", version, notes)
         return True
     except Exception as e:
         session.rollback()
-        print(f"DEBUG: Failed to set database version: {e}")
+        logger.warning("Failed to set database version: %s", e)
         return False
     finally:
         session.close()
 
+def _create_missing_indexes(table):
+    """Create any of the table's indexes that do not exist yet (expression indexes included)"""
+    with _engine.begin() as conn:
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
 def migrate_database():
     """Perform database migrations"""
     global _engine
@@ -144,40 +172,39 @@ def migrate_database():
         return False
     
     current_version = get_database_version()
-    print(f"DEBUG: Current database version: {current_version}, Target version: {CURRENT_DB_VERSION}")
+    logger.debug("Current database version: %s, Target version: %s", current_version, CURRENT_DB_VERSION)
     
     if current_version == CURRENT_DB_VERSION:
-        print("DEBUG: Database is up to date")
+        logger.debug("Database is up to date")
         return True
     
     if current_version == 0:
-        print("DEBUG: Fresh database - creating all tables")
+        logger.debug("Fresh database - creating all tables")
         Base.metadata.create_all(_engine)
         set_database_version(CURRENT_DB_VERSION, "Initial database creation")
         return True
     
     # Perform incremental migrations
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     
     try:
         if current_version < 2:
-            print("DEBUG: Migrating to version 2 - Enhanced scraped tweets schema")
+            logger.debug("Migrating to version 2 - Enhanced scraped tweets schema")
             
             # Check if scraped_tweets table exists, if not create it
             inspector = inspect(_engine)
             if 'scraped_tweets' not in inspector.get_table_names():
-                print("DEBUG: Creating scraped_tweets table")
+                logger.debug("Creating scraped_tweets table")
                 ScrapedTweet.__table__.create(_engine)
             else:
-                print("DEBUG: scraped_tweets table already exists")
+                logger.debug("scraped_tweets table already exists")
             
             # Update version
             set_database_version(2, "Added scraped_tweets table with enhanced duplicate checking")
         
         # Migration to version 3 - Add display_name column to campaigns (non-destructive)
         if current_version < 3:
-            print("DEBUG: Migrating to version 3 - Adding display_name column to campaigns")
+            logger.debug("Migrating to version 3 - Adding display_name column to campaigns")
             
             # Use IF NOT EXISTS approach - check if column already exists first
             inspector = inspect(_engine)
@@ -188,47 +215,123 @@ def migrate_database():
                 try:
                     # Use proper text() wrapper for SQLAlchemy 2.0+
                     session.execute(text('ALTER TABLE campaigns ADD COLUMN display_name VARCHAR(300)'))
-                    print("DEBUG: Added display_name column to campaigns table")
+                    logger.debug("Added display_name column to campaigns table")
                 except Exception as e:
-                    print(f"DEBUG: Failed to add display_name column: {e}")
+                    logger.warning("Failed to add display_name column: %s", e)
                     # Don't raise - this is non-destructive, just log and continue
             else:
-                print("DEBUG: display_name column already exists, skipping")
+                logger.debug("display_name column already exists, skipping")
             
             # Update version
             set_database_version(3, "Added display_name column to campaigns for human-readable names")
         
+        # Migration to version 4 - Keyset pagination index on scraped_tweets
+        if current_version < 4:
+            logger.debug("Migrating to version 4 - Adding (date, tweet_id) index to scraped_tweets")
+            _create_missing_indexes(ScrapedTweet.__table__)
+            set_database_version(4, "Added (date, tweet_id) index to scraped_tweets for keyset pagination")
+        
+        # Migration to version 5 - Index for case-insensitive status lookups on tweets
+        if current_version < 5:
+            logger.debug("Migrating to version 5 - Adding lower(status) index to tweets")
+            _create_missing_indexes(Tweet.__table__)
+            set_database_version(5, "Added lower(status) index to tweets for status filtering")
+        
+        # Migration to version 6 - Composite index for per-campaign status counts
+        if current_version < 6:
+            logger.debug("Migrating to version 6 - Adding (campaign_batch, status) index to tweets")
+            _create_missing_indexes(Tweet.__table__)
+            set_database_version(6, "Added (campaign_batch, status) index to tweets for campaign status counts")
+        
+        # Migration to version 7 - Status index extended with the status-page sort keys
+        if current_version < 7:
+            logger.debug("Migrating to version 7 - Replacing lower(status) index with (lower(status), last_modified, id)")
+            _create_missing_indexes(Tweet.__table__)
+            with _engine.begin() as conn:
+                conn.execute(text("DROP INDEX IF EXISTS ix_tweets_status_lower"))
+            set_database_version(7, "Replaced lower(status) index with (lower(status), last_modified, id) for status paging")
+        
+        # Migration to version 8 - execution_id index on scraped_tweets
+        if current_version < 8:
+            logger.debug("Migrating to version 8 - Adding execution_id index to scraped_tweets")
+            _create_missing_indexes(ScrapedTweet.__table__)
+            set_database_version(8, "Added execution_id index to scraped_tweets for duplicate checks")
+        
+        # Migration to version 9 - (campaign_batch, id) index on tweets
+        if current_version < 9:
+            logger.debug("Migrating to version 9 - Adding (campaign_batch, id) index to tweets")
+            _create_missing_indexes(Tweet.__table__)
+            set_database_version(9, "Added (campaign_batch, id) index to tweets for campaign lookups and export paging")
+        
         session.commit()
-        print(f"DEBUG: Database migration completed - now at version {CURRENT_DB_VERSION}")
+        logger.debug("Database migration completed - now at version %s", CURRENT_DB_VERSION)
         return True
         
     except Exception as e:
         session.rollback()
-        print(f"DEBUG: Database migration failed: {e}")
+        logger.error("Database migration failed: %s", e)
         return False
     finally:
         session.close()
 
+def _json_dumps(value):
+    """JSON column serializer - orjson, returning str as the drivers expect"""
+    return orjson.dumps(value).decode()
+
 def init_database():
     """Initialize database connection and perform migrations"""
-    global _engine, _Session
+    global _engine, _session_factory, _Session
     database_url = get_database_url()
     
-    print(f"DEBUG: Initializing database with URL: {database_url}")
+    logger.debug("Initializing database with URL: %s", database_url)
+    
+    # Create engine - server databases get a larger LIFO pool (idle connections age out instead of
+    # all staying warm) with liveness checks on checkout
+    # JSON columns are encoded and decoded with orjson rather than the stdlib json module
+    json_options = {'json_serializer': _json_dumps, 'json_deserializer': orjson.loads}
+    if database_url.startswith('sqlite'):
+        _engine = create_engine(database_url, echo=False, pool_recycle=3600, **json_options)
+    else:
+        _engine = create_engine(database_url, echo=False, pool_recycle=1800,
+                                pool_size=10, max_overflow=20, pool_pre_ping=True, pool_use_lifo=True,
+                                **json_options)
+    _session_factory = sessionmaker(bind=_engine)
     
-    # Create engine
-    _engine = create_engine(database_url, echo=False, pool_recycle=3600)
+    if database_url.startswith('sqlite'):
+        # WAL lets readers proceed during writes; NORMAL sync is safe under WAL and much cheaper
+        @event.listens_for(_engine, 'connect')
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            # Wait for another process's write lock instead of failing with "database is locked"
+            cursor.execute('PRAGMA busy_timeout=5000')
+            cursor.close()
+    
+    # Optional slow-query log: SLOW_QUERY_MS=<milliseconds> logs statements that take at least that long
+    slow_query_ms = float(os.environ.get('SLOW_QUERY_MS') or 0)
+    if slow_query_ms > 0:
+        @event.listens_for(_engine, 'before_cursor_execute')
+        def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+            conn.info['query_start'] = time.perf_counter()
+        
+        @event.listens_for(_engine, 'after_cursor_execute')
+        def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - conn.info['query_start']) * 1000
+            if elapsed_ms >= slow_query_ms:
+                logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
     
     # Create minimal tables needed for version checking
     DatabaseVersion.__table__.create(_engine, checkfirst=True)
     
     # Perform migrations
     if migrate_database():
-        _Session = sessionmaker(bind=_engine, autoflush=True)
-        print(f"DEBUG: Database initialized successfully at version {CURRENT_DB_VERSION}")
+        # Thread-local session registry; the web app clears it at the end of each request
+        _Session = scoped_session(_session_factory)
+        logger.debug("Database initialized successfully at version %s", CURRENT_DB_VERSION)
         return _engine
     else:
-        print("DEBUG: Database migration failed")
+        logger.error("Database migration failed")
         return None
 
 def get_session():
@@ -243,85 +346,156 @@ def get_session():
     session.autocommit = False
     return session
 
-def save_campaign_data(campaign_data):
-    """Save campaign and tweets to database with smart collision handling and display names"""
-    global _engine
-    if _engine is None:
-        init_database()
-    
+def remove_session():
+    """Close and discard the current thread's scoped session"""
+    if _Session is not None:
+        _Session.remove()
+
+def dispose_engine():
+    """Close every pooled connection (called at interpreter shutdown)"""
+    if _Session is not None:
+        _Session.remove()
+    if _engine is not None:
+        _engine.dispose()
+
+# SQLite allows one writer at a time; writers in this process queue here rather than contending for its lock
+_write_lock = threading.RLock()
+
+def _serialized_write(func):
+    """Run a write function under _write_lock when the database is SQLite"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _engine is not None and _engine.dialect.name == 'sqlite':
+            with _write_lock:
+                return func(*args, **kwargs)
+        return func(*args, **kwargs)
+    return wrapper
+
+def _stage_campaign(session, campaign_data):
+    """Resolve ID collisions and add a campaign and its tweets to session (not committed) - returns the tweet count"""
     original_batch = campaign_data['campaign_batch']
-    print(f"DEBUG: Saving campaign {original_batch} with {len(campaign_data.get('tweets', []))} tweets")
+    logger.debug("Saving campaign %s with %s tweets", original_batch, len(campaign_data.get('tweets', [])))
     
     # Handle campaign batch ID collision
-    unique_campaign_batch = get_unique_campaign_batch(original_batch)
+    unique_campaign_batch = get_unique_campaign_batch(original_batch, session=session)
     if unique_campaign_batch != original_batch:
-        print(f"DEBUG: Campaign batch collision resolved: {original_batch} -> {unique_campaign_batch}")
+        logger.debug("Campaign batch collision resolved: %s -> %s", original_batch, unique_campaign_batch)
         campaign_data['campaign_batch'] = unique_campaign_batch
     
     # Generate human-readable display name
     display_name = generate_display_name(campaign_data)
-    print(f"DEBUG: Generated display name: '{display_name}'")
+    logger.debug("Generated display name: '%s'", display_name)
+    
+    # Handle tweet ID collisions - one IN query finds the taken ids, only those get a suffix lookup
+    tweets_to_save = campaign_data.get('tweets', [])
+    ids = [tweet_data['id'] for tweet_data in tweets_to_save]
+    taken = {tweet_id for (tweet_id,) in session.query(Tweet.id).filter(Tweet.id.in_(ids))} if ids else set()
+    for tweet_data in tweets_to_save:
+        original_id = tweet_data['id']
+        if original_id in taken:
+            unique_id = get_unique_tweet_id(original_id, unique_campaign_batch, session=session)
+            if unique_id != original_id:
+                logger.debug("Tweet ID collision resolved: %s -> %s", original_id, unique_id)
+                tweet_data['id'] = unique_id
+        # Update campaign_batch reference in tweet
+        tweet_data['campaign_batch'] = unique_campaign_batch
+    
+    # Build every row before touching the session so malformed data leaves it clean
+    campaign = Campaign(
+        campaign_batch=unique_campaign_batch,
+        generated_at=datetime.fromisoformat(campaign_data['generated_at']),
+        tweet_count=len(tweets_to_save),  # Use actual count
+        analysis_summary=campaign_data.get('analysis_summary', {}),
+        title=campaign_data.get('title', ''),
+        description=campaign_data.get('description', ''),
+        source_type=campaign_data.get('source_type', 'api'),
+        display_name=display_name
+    )
+    tweet_rows = [{
+        'id': tweet_data['id'],
+        'campaign_batch': unique_campaign_batch,
+        'type': tweet_data['type'],
+        'content': tweet_data['content'],
+        'character_count': tweet_data['character_count'],
+        'status': tweet_data.get('status', 'Draft'),
+        'engagement_hook': tweet_data.get('engagement_hook', ''),
+        'coophive_elements': tweet_data.get('coophive_elements', []),
+        'discord_voice_patterns': tweet_data.get('discord_voice_patterns', []),
+        'theme_connection': tweet_data.get('theme_connection', ''),
+        'is_edited': tweet_data.get('is_edited', False)
+    } for tweet_data in tweets_to_save]
+    
+    session.add(campaign)
+    # Save tweets with a Core executemany INSERT (batched into multi-row VALUES), skipping the unit of work
+    if tweet_rows:
+        session.execute(insert(Tweet), tweet_rows)
+    return len(tweets_to_save)
+
+@_serialized_write
+def save_campaign_data(campaign_data):
+    """Save campaign and tweets to database with smart collision handling and display names"""
+    global _engine
+    if _engine is None:
+        init_database()
     
     # Create a fresh session for this operation
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     
     try:
-        # Handle tweet ID collisions
-        tweets_to_save = campaign_data.get('tweets', [])
-        for tweet_data in tweets_to_save:
-            original_id = tweet_data['id']
-            unique_id = get_unique_tweet_id(original_id, unique_campaign_batch)
-            if unique_id != original_id:
-                print(f"DEBUG: Tweet ID collision resolved: {original_id} -> {unique_id}")
-                tweet_data['id'] = unique_id
-            # Update campaign_batch reference in tweet
-            tweet_data['campaign_batch'] = unique_campaign_batch
-        
-        # Save campaign with display name
-        campaign = Campaign(
-            campaign_batch=unique_campaign_batch,
-            generated_at=datetime.fromisoformat(campaign_data['generated_at']),
-            tweet_count=len(tweets_to_save),  # Use actual count
-            analysis_summary=campaign_data.get('analysis_summary', {}),
-            title=campaign_data.get('title', ''),
-            description=campaign_data.get('description', ''),
-            source_type=campaign_data.get('source_type', 'api'),
-            display_name=display_name
-        )
-        session.add(campaign)
-        
-        # Save tweets
-        for i, tweet_data in enumerate(tweets_to_save):
-            print(f"DEBUG: Saving tweet {i+1}: {tweet_data.get('id', 'NO_ID')}")
-            tweet = Tweet(
-                id=tweet_data['id'],
-                campaign_batch=unique_campaign_batch,
-                type=tweet_data['type'],
-                content=tweet_data['content'],
-                character_count=tweet_data['character_count'],
-                status=tweet_data.get('status', 'Draft'),
-                engagement_hook=tweet_data.get('engagement_hook', ''),
-                coophive_elements=tweet_data.get('coophive_elements', []),
-                discord_voice_patterns=tweet_data.get('discord_voice_patterns', []),
-                theme_connection=tweet_data.get('theme_connection', ''),
-                is_edited=tweet_data.get('is_edited', False)
-            )
-            session.add(tweet)
+        tweet_count = _stage_campaign(session, campaign_data)
         
         # Commit everything
         session.commit()
-        print(f"DEBUG: Successfully saved campaign '{unique_campaign_batch}' with {len(tweets_to_save)} tweets")
-        print(f"DEBUG: Display name: '{display_name}'")
+        logger.debug("Successfully saved campaign '%s' with %s tweets", campaign_data['campaign_batch'], tweet_count)
         return True
         
     except Exception as e:
         session.rollback()
-        print(f"DEBUG: Database save error: {e}")
+        logger.warning("Database save error: %s", e)
         return False
     finally:
         session.close()
 
+@_serialized_write
+def save_campaigns_bulk(campaigns):
+    """Save several campaigns in one transaction - returns a success flag per campaign, in order"""
+    global _engine
+    if _engine is None:
+        init_database()
+    
+    session = _session_factory()
+    
+    try:
+        results = []
+        for campaign_data in campaigns:
+            try:
+                _stage_campaign(session, campaign_data)
+            except SQLAlchemyError:
+                raise
+            except Exception as e:
+                # Malformed campaign - skip it without disturbing the rest of the batch
+                logger.warning("Skipping campaign %s: %s", campaign_data.get('campaign_batch'), e)
+                results.append(False)
+            else:
+                results.append(True)
+        
+        session.commit()
+        logger.debug("Saved %s of %s campaigns in one transaction", sum(results), len(results))
+        return results
+        
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.warning("Batch campaign save failed (%s) - saving campaigns one at a time", e)
+    finally:
+        session.close()
+    
+    return [save_campaign_data(campaign_data) for campaign_data in campaigns]
+
+# Tweet columns returned with a campaign
+_CAMPAIGN_TWEET_COLUMNS = (Tweet.id, Tweet.type, Tweet.content, Tweet.character_count, Tweet.status,
+                           Tweet.engagement_hook, Tweet.coophive_elements, Tweet.discord_voice_patterns,
+                           Tweet.theme_connection, Tweet.is_edited, Tweet.last_modified, Tweet.posted_date)
+
 def get_campaign_data(campaign_batch):
     """Get campaign and tweets from database - SIMPLE VERSION"""
     global _engine
@@ -329,19 +503,31 @@ def get_campaign_data(campaign_batch):
         init_database()
     
     # Create a fresh session for this operation
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     
     try:
         # Get campaign
         campaign = session.query(Campaign).filter_by(campaign_batch=campaign_batch).first()
         if not campaign:
-            print(f"DEBUG: No campaign found in database for {campaign_batch}")
+            logger.debug("No campaign found in database for %s", campaign_batch)
             return None
         
-        # Get tweets
-        tweets = session.query(Tweet).filter_by(campaign_batch=campaign_batch).all()
-        print(f"DEBUG: Retrieved {len(tweets)} tweets from database for campaign {campaign_batch}")
+        # Get tweets as plain column rows, fetched in batches rather than as ORM objects
+        tweets = [{
+            'id': row.id,
+            'type': row.type,
+            'content': row.content,
+            'character_count': row.character_count,
+            'status': row.status,
+            'engagement_hook': row.engagement_hook,
+            'coophive_elements': row.coophive_elements or [],
+            'discord_voice_patterns': row.discord_voice_patterns or [],
+            'theme_connection': row.theme_connection,
+            'is_edited': row.is_edited,
+            'last_modified': row.last_modified.isoformat() if row.last_modified else None,
+            'posted_date': row.posted_date.isoformat() if row.posted_date else None
+        } for row in session.query(*_CAMPAIGN_TWEET_COLUMNS).filter_by(campaign_batch=campaign_batch).yield_per(500)]
+        logger.debug("Retrieved %s tweets from database for campaign %s", len(tweets), campaign_batch)
         
         # Convert to dictionary format
         campaign_data = {
@@ -353,93 +539,195 @@ def get_campaign_data(campaign_batch):
             'description': campaign.description or '',
             'source_type': campaign.source_type or 'unknown',
             'display_name': campaign.display_name or '',
-            'tweets': []
+            'tweets': tweets
         }
         
-        for tweet in tweets:
-            tweet_dict = {
-                'id': tweet.id,
-                'type': tweet.type,
-                'content': tweet.content,
-                'character_count': tweet.character_count,
-                'status': tweet.status,
-                'engagement_hook': tweet.engagement_hook,
-                'coophive_elements': tweet.coophive_elements or [],
-                'discord_voice_patterns': tweet.discord_voice_patterns or [],
-                'theme_connection': tweet.theme_connection,
-                'is_edited': tweet.is_edited,
-                'last_modified': tweet.last_modified.isoformat() if tweet.last_modified else None,
-                'posted_date': tweet.posted_date.isoformat() if tweet.posted_date else None
-            }
-            campaign_data['tweets'].append(tweet_dict)
-        
-        print(f"DEBUG: Returning campaign data with {len(campaign_data['tweets'])} tweets")
+        logger.debug("Returning campaign data with %s tweets", len(campaign_data['tweets']))
         return campaign_data
         
     except Exception as e:
-        print(f"DEBUG: Database get error: {e}")
+        logger.warning("Database get error: %s", e)
         return None
     finally:
         session.close()
 
+@_serialized_write
 def update_tweet_content(campaign_batch, tweet_id, new_content):
     """Update tweet content in database - SIMPLE VERSION"""
     global _engine
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        tweet = session.query(Tweet).filter_by(
-            campaign_batch=campaign_batch, 
-            id=tweet_id
-        ).first()
-        
-        if tweet:
-            tweet.content = new_content
-            tweet.character_count = len(new_content)
-            tweet.is_edited = True
-            tweet.last_modified = datetime.utcnow()
-            session.commit()
-            return True
-        return False
+        # Single UPDATE instead of loading the row first
+        result = session.execute(update(Tweet).where(
+            Tweet.campaign_batch == campaign_batch,
+            Tweet.id == tweet_id
+        ).values(
+            content=new_content,
+            character_count=len(new_content),
+            is_edited=True,
+            last_modified=datetime.utcnow()
+        ).execution_options(synchronize_session=False))
+        session.commit()
+        return result.rowcount > 0
     except Exception as e:
         session.rollback()
-        print(f"Database error: {e}")
+        logger.warning("Database error: %s", e)
         return False
     finally:
         session.close()
 
+@_serialized_write
 def update_tweet_status(campaign_batch, tweet_id, new_status):
     """Update tweet status in database - SIMPLE VERSION"""
     global _engine
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        tweet = session.query(Tweet).filter_by(
-            campaign_batch=campaign_batch, 
-            id=tweet_id
-        ).first()
-        
-        if tweet:
-            tweet.status = new_status
-            tweet.last_modified = datetime.utcnow()
-            if new_status == 'Posted':
-                tweet.posted_date = datetime.utcnow()
-            session.commit()
-            return True
-        return False
+        now = datetime.utcnow()
+        values = {'status': new_status, 'last_modified': now}
+        if new_status == 'Posted':
+            values['posted_date'] = now
+        
+        # Single UPDATE instead of loading the row first
+        result = session.execute(update(Tweet).where(
+            Tweet.campaign_batch == campaign_batch,
+            Tweet.id == tweet_id
+        ).values(**values).execution_options(synchronize_session=False))
+        session.commit()
+        return result.rowcount > 0
     except Exception as e:
         session.rollback()
-        print(f"Database error: {e}")
+        logger.warning("Database error: %s", e)
         return False
     finally:
         session.close()
 
+def encode_keyset_cursor(when, key):
+    """Opaque keyset cursor for the row at (when, key) in a newest-first listing"""
+    raw = f"{when.isoformat() if when else ''}|{key}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_keyset_cursor(cursor):
+    """Inverse of encode_keyset_cursor - returns (when, key), or None if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        when_str, key = raw.split('|', 1)
+        if not key:
+            # Row keys are never empty - a truncated cursor can decode to one
+            return None
+        return (datetime.fromisoformat(when_str) if when_str else None), key
+    except (ValueError, UnicodeError, binascii.Error):
+        return None
+
+# Display order for the status pages (newest edit first, id as tie-breaker)
+_STATUS_ORDER = (Tweet.last_modified.desc().nullslast(), Tweet.id.desc())
+_STATUS_COLUMNS = (Tweet.id, Tweet.campaign_batch, Tweet.type, Tweet.content, Tweet.character_count,
+                   Tweet.status, Tweet.engagement_hook, Tweet.last_modified, Tweet.posted_date)
+
+def get_status_tweets_page(status, limit=None, cursor=None):
+    """Get tweets with a status (case-insensitive), newest first - returns (tweets, next_cursor) or None on error"""
+    global _engine
+    if _engine is None:
+        init_database()
+    
+    session = _session_factory()
+    try:
+        # Plain column rows instead of ORM entities; datetimes are left for orjson to serialize
+        query = session.query(*_STATUS_COLUMNS).filter(func.lower(Tweet.status) == status.lower())
+        
+        after = decode_keyset_cursor(cursor) if cursor else None
+        if after:
+            last_modified, tweet_id = after
+            if last_modified is None:
+                query = query.filter(Tweet.last_modified.is_(None), Tweet.id < tweet_id)
+            else:
+                query = query.filter(or_(
+                    Tweet.last_modified < last_modified,
+                    and_(Tweet.last_modified == last_modified, Tweet.id < tweet_id),
+                    Tweet.last_modified.is_(None)
+                ))
+        
+        query = query.order_by(*_STATUS_ORDER)
+        if limit:
+            query = query.limit(limit)
+        tweets = [dict(row) for row in session.execute(query.statement).mappings()]
+        
+        next_cursor = None
+        if limit and len(tweets) == limit:
+            next_cursor = encode_keyset_cursor(tweets[-1]['last_modified'], tweets[-1]['id'])
+        
+        return tweets, next_cursor
+        
+    except Exception as e:
+        logger.warning("Error getting tweets by status: %s", e)
+        return None
+    finally:
+        session.close()
+
+# Columns and order for the all-tweets listing and CSV export (newest campaign first)
+_EXPORT_COLUMNS = (Tweet.id, Tweet.campaign_batch, Tweet.type, Tweet.content, Tweet.character_count,
+                   Tweet.status, Tweet.engagement_hook, Tweet.last_modified, Tweet.posted_date)
+# NULL campaign_batch rows sort last on every backend so the keyset below can reach them
+_EXPORT_ORDER = (Tweet.campaign_batch.desc().nullslast(), Tweet.id)
+
+def _iter_all_tweet_rows(batch_size):
+    """Yield raw (_EXPORT_COLUMNS) row tuples for every tweet in keyset batches - errors propagate"""
+    global _engine
+    if _engine is None:
+        init_database()
+    
+    session = _session_factory()
+    try:
+        last = None
+        while True:
+            query = session.query(*_EXPORT_COLUMNS)
+            if last and last[0] is None:
+                # Already in the trailing NULL-campaign block
+                query = query.filter(Tweet.campaign_batch.is_(None), Tweet.id > last[1])
+            elif last:
+                query = query.filter(or_(
+                    Tweet.campaign_batch < last[0],
+                    and_(Tweet.campaign_batch == last[0], Tweet.id > last[1]),
+                    Tweet.campaign_batch.is_(None)
+                ))
+            rows = query.order_by(*_EXPORT_ORDER).limit(batch_size).all()
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            last = (rows[-1].campaign_batch, rows[-1].id)
+    finally:
+        session.close()
+
+def iter_all_tweets(batch_size=500):
+    """Yield every tweet as a dict, newest campaign first, fetched in keyset batches - errors propagate"""
+    for row in _iter_all_tweet_rows(batch_size):
+        yield {
+            'id': row.id,
+            'campaign_batch': row.campaign_batch,
+            'type': row.type,
+            'content': row.content,
+            'character_count': row.character_count,
+            'status': row.status,
+            'engagement_hook': row.engagement_hook,
+            'last_modified': row.last_modified.isoformat() if row.last_modified else None,
+            'posted_date': row.posted_date.isoformat() if row.posted_date else None,
+            'generated_at': '',
+            'deleted_at': None  # tweets has no deleted_at column
+        }
+
+def iter_all_tweet_csv_rows(batch_size=1000):
+    """Yield every tweet as a tuple in the all-tweets CSV column order, skipping the dict stage"""
+    for (tweet_id, campaign_batch, tweet_type, content, character_count,
+         status, engagement_hook, last_modified, posted_date) in _iter_all_tweet_rows(batch_size):
+        yield (tweet_id, campaign_batch, '', content, character_count, tweet_type, status, engagement_hook,
+               last_modified.isoformat() if last_modified else None,
+               posted_date.isoformat() if posted_date else None, None, '')
+
 # ============================================================================
 # SCRAPED TWEETS MANAGEMENT FUNCTIONS
 # ============================================================================
@@ -459,65 +747,79 @@ def check_duplicate_scraped_tweets(tweet_ids, execution_id=None):
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        existing_ids = set()
-        
-        # Initialize tracking variables
-        execution_duplicate_ids = set()
-        tweet_duplicate_ids = set()
-        
-        # STEP 1: Check for duplicate execution_id (if provided)
+        # One round trip covers both checks: rows from the same execution and rows with a known Tweet ID.
+        # Every returned row matched one of them, so all of its (unique) tweet_ids are duplicates.
+        criteria = ScrapedTweet.tweet_id.in_(tweet_ids)
         if execution_id:
-            execution_duplicates = session.query(ScrapedTweet.tweet_id).filter(
-                ScrapedTweet.execution_id == execution_id
-            ).all()
-            execution_duplicate_ids = {tweet.tweet_id for tweet in execution_duplicates}
-            
-            if execution_duplicate_ids:
-                print(f"DEBUG: Found {len(execution_duplicate_ids)} tweets with same execution_id: {execution_id}")
-                existing_ids.update(execution_duplicate_ids)
-        
-        # STEP 2: Check for duplicate Tweet IDs (global check)
-        tweet_id_duplicates = session.query(ScrapedTweet.tweet_id).filter(
-            ScrapedTweet.tweet_id.in_(tweet_ids)
-        ).all()
-        tweet_duplicate_ids = {tweet.tweet_id for tweet in tweet_id_duplicates}
-        
-        if tweet_duplicate_ids:
-            print(f"DEBUG: Found {len(tweet_duplicate_ids)} tweets with duplicate Tweet IDs")
-            existing_ids.update(tweet_duplicate_ids)
+            criteria = or_(criteria, ScrapedTweet.execution_id == execution_id)
+        requested_ids = set(tweet_ids)
+        existing_ids = set()
+        execution_duplicates = tweet_duplicates = 0
+        for tweet_id, row_execution_id in session.query(ScrapedTweet.tweet_id, ScrapedTweet.execution_id).filter(criteria):
+            existing_ids.add(tweet_id)
+            # STEP 1: Duplicate execution_id (if provided)
+            if execution_id and row_execution_id == execution_id:
+                execution_duplicates += 1
+            # STEP 2: Duplicate Tweet IDs (global check)
+            if tweet_id in requested_ids:
+                tweet_duplicates += 1
         
         # Calculate new tweet IDs
         new_ids = [tid for tid in tweet_ids if tid not in existing_ids]
         
-        print(f"DEBUG: Checked {len(tweet_ids)} tweets - {len(existing_ids)} duplicates, {len(new_ids)} new")
-        print(f"DEBUG: Execution duplicates: {len(execution_duplicate_ids)}, Tweet ID duplicates: {len(tweet_duplicate_ids)}")
+        logger.debug("Checked %s tweets - %s duplicates, %s new (execution duplicates: %s, Tweet ID duplicates: %s)",
+                     len(tweet_ids), len(existing_ids), len(new_ids), execution_duplicates, tweet_duplicates)
         
         return list(existing_ids), new_ids
         
     except Exception as e:
-        print(f"Database error checking duplicates: {e}")
+        logger.warning("Database error checking duplicates: %s", e)
         return [], tweet_ids  # Return all as new if error
     finally:
         session.close()
 
+def _insert_ignore_duplicates(model):
+    """INSERT for model that silently skips rows conflicting with an existing primary key"""
+    if _engine.dialect.name == 'postgresql':
+        return pg_insert(model).on_conflict_do_nothing()
+    if _engine.dialect.name == 'sqlite':
+        return sqlite_insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+# Month abbreviations in Twitter's created_at format
+_TWITTER_MONTHS = {month: number for number, month in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+
+def _parse_twitter_date(value):
+    """Parse a Twitter date ("Mon Aug 04 17:15:25 +0000 2025") - UTC values are sliced directly, others use strptime"""
+    if len(value) == 30 and value[20:25] == '+0000' and value[4:7] in _TWITTER_MONTHS:
+        try:
+            return datetime(int(value[26:30]), _TWITTER_MONTHS[value[4:7]], int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]), tzinfo=timezone.utc)
+        except ValueError:
+            pass  # Malformed field - let strptime produce the error
+    return datetime.strptime(value, "%a %b %d %H:%M:%S %z %Y")
+
+@_serialized_write
 def save_scraped_tweets(tweets_data, execution_id, source_url):
     """
     Save scraped tweets to database
     tweets_data: List of tweet dictionaries from n8n
-    Returns: (success_count, error_count, errors)
+    Returns: (success_count, error_count, errors, skipped_count) - skipped_count counts rows
+    whose Tweet ID already exists and were left untouched
     """
     global _engine
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     success_count = 0
     error_count = 0
+    skipped_count = 0
     errors = []
+    rows = []
     
     try:
         for tweet_data in tweets_data:
@@ -527,116 +829,187 @@ def save_scraped_tweets(tweets_data, execution_id, source_url):
                 if tweet_data.get('Date'):
                     try:
                         # Parse Twitter date format: "Mon Aug 04 17:15:25 +0000 2025"
-                        tweet_date = datetime.strptime(tweet_data['Date'], "%a %b %d %H:%M:%S %z %Y")
+                        tweet_date = _parse_twitter_date(tweet_data['Date'])
                     except ValueError as e:
-                        print(f"Date parse error for tweet {tweet_data.get('Tweet ID')}: {e}")
+                        logger.warning("Date parse error for tweet %s: %s", tweet_data.get('Tweet ID'), e)
                         tweet_date = datetime.utcnow()
                 
-                # Create ScrapedTweet object
-                scraped_tweet = ScrapedTweet(
-                    tweet_id=tweet_data['Tweet ID'],
-                    url=tweet_data.get('URL', ''),
-                    content=tweet_data.get('Content', ''),
-                    likes=int(tweet_data.get('Likes', 0)),
-                    retweets=int(tweet_data.get('Retweets', 0)),
-                    replies=int(tweet_data.get('Replies', 0)),
-                    quotes=int(tweet_data.get('Quotes', 0)),
-                    views=int(tweet_data.get('Views', 0)),
-                    date=tweet_date,
-                    status=tweet_data.get('Status', 'success'),
-                    tweet_url=tweet_data.get('Tweet', ''),
-                    execution_id=execution_id,
-                    source_url=source_url
-                )
-                
-                session.add(scraped_tweet)
+                # Build the row; all rows go out in one executemany INSERT below
+                rows.append({
+                    'tweet_id': tweet_data['Tweet ID'],
+                    'url': tweet_data.get('URL', ''),
+                    'content': tweet_data.get('Content', ''),
+                    'likes': int(tweet_data.get('Likes', 0)),
+                    'retweets': int(tweet_data.get('Retweets', 0)),
+                    'replies': int(tweet_data.get('Replies', 0)),
+                    'quotes': int(tweet_data.get('Quotes', 0)),
+                    'views': int(tweet_data.get('Views', 0)),
+                    'date': tweet_date,
+                    'status': tweet_data.get('Status', 'success'),
+                    'tweet_url': tweet_data.get('Tweet', ''),
+                    'execution_id': execution_id,
+                    'source_url': source_url
+                })
                 success_count += 1
                 
             except Exception as e:
                 error_count += 1
                 error_msg = f"Error saving tweet {tweet_data.get('Tweet ID', 'unknown')}: {str(e)}"
                 errors.append(error_msg)
-                print(f"DEBUG: {error_msg}")
+                logger.debug("%s", error_msg)
         
-        # Commit all successfully created tweets
-        if success_count > 0:
+        # Insert and commit all successfully built tweets; rows whose Tweet ID already exists
+        # (e.g. saved by a concurrent batch since the duplicate check) are skipped by the database
+        if rows:
+            stmt = _insert_ignore_duplicates(ScrapedTweet).returning(ScrapedTweet.tweet_id)
+            inserted = session.execute(stmt, rows).all()
+            skipped_count = success_count - len(inserted)
+            if skipped_count:
+                logger.debug("Skipped %s scraped tweets that already exist", skipped_count)
+            success_count = len(inserted)
             session.commit()
-            print(f"DEBUG: Successfully saved {success_count} scraped tweets")
+            invalidate_scraped_count_cache()
+            logger.debug("Successfully saved %s scraped tweets", success_count)
         
-        return success_count, error_count, errors
+        return success_count, error_count, errors, skipped_count
         
     except Exception as e:
         session.rollback()
-        print(f"Database error saving scraped tweets: {e}")
-        return 0, len(tweets_data), [f"Database error: {str(e)}"]
+        logger.warning("Database error saving scraped tweets: %s", e)
+        return 0, len(tweets_data), [f"Database error: {str(e)}"], 0
     finally:
         session.close()
 
-def get_scraped_tweets(limit=None, offset=None, execution_id=None):
+# Columns read for scraped tweet listings (plain rows instead of ORM objects)
+_SCRAPED_COLUMNS = (ScrapedTweet.tweet_id, ScrapedTweet.url, ScrapedTweet.content, ScrapedTweet.likes,
+                    ScrapedTweet.retweets, ScrapedTweet.replies, ScrapedTweet.quotes, ScrapedTweet.views,
+                    ScrapedTweet.date, ScrapedTweet.status, ScrapedTweet.tweet_url, ScrapedTweet.execution_id,
+                    ScrapedTweet.source_url, ScrapedTweet.created_at,
+                    (ScrapedTweet.likes + ScrapedTweet.retweets + ScrapedTweet.replies + ScrapedTweet.quotes).label('engagement_total'))
+
+def _scraped_tweet_to_dict(tweet):
+    """Convert a _SCRAPED_COLUMNS row to the n8n-style dictionary used by the UI and exports"""
+    # Format the date for better display
+    formatted_date = None
+    if tweet.date:
+        try:
+            formatted_date = tweet.date.strftime("%Y-%m-%d %H:%M:%S")
+        except:
+            formatted_date = str(tweet.date)
+    
+    return {
+        'Tweet ID': tweet.tweet_id,
+        'URL': tweet.url,
+        'Content': tweet.content,
+        'Likes': tweet.likes,
+        'Retweets': tweet.retweets,
+        'Replies': tweet.replies,
+        'Quotes': tweet.quotes,
+        'Views': tweet.views,
+        'Date': formatted_date,
+        'Status': tweet.status,
+        'Tweet': tweet.tweet_url,
+        'execution_id': tweet.execution_id,
+        'source_url': tweet.source_url,
+        'created_at': tweet.created_at.strftime("%Y-%m-%d %H:%M:%S") if tweet.created_at else None,
+        'engagement_total': tweet.engagement_total
+    }
+
+# Display order for scraped tweets: newest first, tweet_id as a unique tie-breaker so the
+# order is total and can be resumed from a (date, tweet_id) keyset cursor
+_SCRAPED_ORDER = (ScrapedTweet.date.desc().nullslast(), ScrapedTweet.tweet_id.desc())
+
+def _after_scraped_cursor(query, date, tweet_id):
+    """Restrict query to rows that come after (date, tweet_id) in display order"""
+    if date is None:
+        # Already in the trailing NULL-date block
+        return query.filter(ScrapedTweet.date.is_(None), ScrapedTweet.tweet_id < tweet_id)
+    return query.filter(or_(
+        ScrapedTweet.date < date,
+        and_(ScrapedTweet.date == date, ScrapedTweet.tweet_id < tweet_id),
+        ScrapedTweet.date.is_(None)
+    ))
+
+# Short-lived cache of scraped tweet counts keyed by the execution_id filter (None = all rows).
+# Only large counts are cached (small ones are cheap to recount) and every write clears it.
+_SCRAPED_COUNT_TTL = 30
+_SCRAPED_COUNT_MIN_CACHED = 1000
+_SCRAPED_COUNT_MAX_KEYS = 128
+_scraped_count_cache = {}
+
+def _count_scraped_tweets(query, execution_id):
+    """COUNT(*) for the filtered scraped tweets query, served from the TTL cache when fresh"""
+    cached = _scraped_count_cache.get(execution_id)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    total_count = query.count()
+    if total_count >= _SCRAPED_COUNT_MIN_CACHED:
+        if len(_scraped_count_cache) >= _SCRAPED_COUNT_MAX_KEYS:
+            _scraped_count_cache.clear()
+        _scraped_count_cache[execution_id] = (total_count, time.monotonic() + _SCRAPED_COUNT_TTL)
+    return total_count
+
+def invalidate_scraped_count_cache():
+    """Drop cached scraped tweet counts after rows are added or removed"""
+    _scraped_count_cache.clear()
+
+def iter_scraped_tweets(execution_id=None, batch_size=1000):
+    """Yield every scraped tweet as a dict in display order, streamed in batches - errors propagate"""
+    global _engine
+    if _engine is None:
+        init_database()
+    
+    session = _session_factory()
+    try:
+        query = session.query(*_SCRAPED_COLUMNS)
+        if execution_id:
+            query = query.filter(ScrapedTweet.execution_id == execution_id)
+        for tweet in query.order_by(*_SCRAPED_ORDER).yield_per(batch_size):
+            yield _scraped_tweet_to_dict(tweet)
+    finally:
+        session.close()
+
+def get_scraped_tweets_page(per_page, page=1, cursor=None, execution_id=None):
     """
-    Retrieve scraped tweets from database with enhanced pagination support
-    Returns: Tuple of (tweets_data, total_count)
+    Retrieve one page of scraped tweets for the paginated UI
+    Sequential navigation passes the cursor returned for the previous page, which seeks
+    straight to the (date, tweet_id) position via the index instead of scanning and
+    discarding OFFSET rows; page jumps without a cursor fall back to OFFSET.
+    Returns: Tuple of (tweets_data, total_count, next_cursor)
     """
     global _engine
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        # Base query
-        query = session.query(ScrapedTweet)
+        query = session.query(*_SCRAPED_COLUMNS)
         
         if execution_id:
             query = query.filter(ScrapedTweet.execution_id == execution_id)
         
-        # Get total count before applying limit/offset
-        total_count = query.count()
+        total_count = _count_scraped_tweets(query, execution_id)
         
-        # Order by date descending (newest first), then by created_at for consistency
-        query = query.order_by(ScrapedTweet.date.desc(), ScrapedTweet.created_at.desc())
+        after = decode_keyset_cursor(cursor) if cursor else None
+        if after:
+            query = _after_scraped_cursor(query, *after)
         
-        if offset:
-            query = query.offset(offset)
-        if limit:
-            query = query.limit(limit)
+        query = query.order_by(*_SCRAPED_ORDER)
+        if not after and page > 1:
+            query = query.offset((page - 1) * per_page)
         
-        tweets = query.all()
+        tweets = query.limit(per_page).all()
         
-        # Convert to dictionary format with enhanced data
-        tweets_data = []
-        for tweet in tweets:
-            # Format the date for better display
-            formatted_date = None
-            if tweet.date:
-                try:
-                    formatted_date = tweet.date.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    formatted_date = str(tweet.date)
-            
-            tweets_data.append({
-                'Tweet ID': tweet.tweet_id,
-                'URL': tweet.url,
-                'Content': tweet.content,
-                'Likes': tweet.likes,
-                'Retweets': tweet.retweets,
-                'Replies': tweet.replies,
-                'Quotes': tweet.quotes,
-                'Views': tweet.views,
-                'Date': formatted_date,
-                'Status': tweet.status,
-                'Tweet': tweet.tweet_url,
-                'execution_id': tweet.execution_id,
-                'source_url': tweet.source_url,
-                'created_at': tweet.created_at.strftime("%Y-%m-%d %H:%M:%S") if tweet.created_at else None,
-                'engagement_total': tweet.likes + tweet.retweets + tweet.replies + tweet.quotes
-            })
-        
-        return tweets_data, total_count
+        next_cursor = None
+        if len(tweets) == per_page:
+            next_cursor = encode_keyset_cursor(tweets[-1].date, tweets[-1].tweet_id)
+        
+        return [_scraped_tweet_to_dict(tweet) for tweet in tweets], total_count, next_cursor
         
     except Exception as e:
-        print(f"Database error retrieving scraped tweets: {e}")
-        return [], 0
+        logger.warning("Database error retrieving scraped tweets page: %s", e)
+        return [], 0, None
     finally:
         session.close()
 
@@ -646,46 +1019,35 @@ def get_scraped_tweets_stats():
     if _engine is None:
         init_database()
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     try:
-        from sqlalchemy import func
-        
-        # Basic counts
-        total_tweets = session.query(ScrapedTweet).count()
-        
-        # Engagement stats
-        engagement_stats = session.query(
+        # Counts, engagement totals, date range and executions in a single aggregate scan
+        stats = session.query(
+            func.count().label('total_tweets'),
             func.sum(ScrapedTweet.likes).label('total_likes'),
             func.sum(ScrapedTweet.retweets).label('total_retweets'),
             func.sum(ScrapedTweet.replies).label('total_replies'),
             func.sum(ScrapedTweet.views).label('total_views'),
-            func.avg(ScrapedTweet.likes).label('avg_likes')
-        ).first()
-        
-        # Date range
-        date_range = session.query(
+            func.avg(ScrapedTweet.likes).label('avg_likes'),
             func.min(ScrapedTweet.date).label('earliest'),
-            func.max(ScrapedTweet.date).label('latest')
-        ).first()
-        
-        # Execution stats
-        execution_count = session.query(func.count(func.distinct(ScrapedTweet.execution_id))).scalar()
+            func.max(ScrapedTweet.date).label('latest'),
+            func.count(func.distinct(ScrapedTweet.execution_id)).label('execution_count')
+        ).select_from(ScrapedTweet).one()
         
         return {
-            'total_tweets': total_tweets,
-            'total_likes': engagement_stats.total_likes or 0,
-            'total_retweets': engagement_stats.total_retweets or 0,
-            'total_replies': engagement_stats.total_replies or 0,
-            'total_views': engagement_stats.total_views or 0,
-            'avg_likes': round(engagement_stats.avg_likes or 0, 2),
-            'earliest_date': date_range.earliest,
-            'latest_date': date_range.latest,
-            'execution_count': execution_count
+            'total_tweets': stats.total_tweets,
+            'total_likes': stats.total_likes or 0,
+            'total_retweets': stats.total_retweets or 0,
+            'total_replies': stats.total_replies or 0,
+            'total_views': stats.total_views or 0,
+            'avg_likes': round(stats.avg_likes or 0, 2),
+            'earliest_date': stats.earliest,
+            'latest_date': stats.latest,
+            'execution_count': stats.execution_count
         }
         
     except Exception as e:
-        print(f"Database error getting scraped tweet stats: {e}")
+        logger.warning("Database error getting scraped tweet stats: %s", e)
         return {
             'total_tweets': 0,
             'total_likes': 0,
@@ -743,10 +1105,10 @@ def force_migration():
     """Force database migration - use with caution"""
     global _engine
     if _engine is None:
-        print("DEBUG: Cannot migrate - database not initialized")
+        logger.debug("Cannot migrate - database not initialized")
         return False
     
-    print("DEBUG: Forcing database migration...")
+    logger.debug("Forcing database migration...")
     return migrate_database()
 
 def backup_database(backup_path=None):
@@ -756,7 +1118,8 @@ def backup_database(backup_path=None):
     if not database_url.startswith('sqlite:///'):
         return False, "Backup only supported for SQLite databases"
     
-    import shutil
+    import sqlite3
+    from contextlib import closing
     from datetime import datetime
     
     try:
@@ -768,7 +1131,10 @@ def backup_database(backup_path=None):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = f"tweets_backup_{timestamp}.db"
         
-        shutil.copy2(db_file, backup_path)
+        # SQLite's online backup API copies a consistent snapshot (including pages still in the WAL),
+        # 1024 pages per step so writers are not locked out for the whole copy
+        with closing(sqlite3.connect(db_file)) as source, closing(sqlite3.connect(backup_path)) as target:
+            source.backup(target, pages=1024)
         return True, f"Database backed up to {backup_path}"
         
     except Exception as e:
@@ -816,33 +1182,33 @@ def generate_display_name(campaign_data):
             return f"{theme_part} ({tweet_count} tweets)"
             
     except Exception as e:
-        print(f"DEBUG: Error generating display name: {e}")
+        logger.warning("Error generating display name: %s", e)
         tweet_count = len(campaign_data.get('tweets', []))
         return f"Campaign ({tweet_count} tweets)"
 
-def get_unique_campaign_batch(original_batch):
+def get_unique_campaign_batch(original_batch, session=None):
     """Get unique campaign batch ID by adding increment suffix if needed"""
     global _engine
-    if _engine is None:
-        return original_batch
-    
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    own_session = session is None
+    if own_session:
+        if _engine is None:
+            return original_batch
+        session = _session_factory()
     
     try:
-        # Check if original exists
-        existing = session.query(Campaign).filter_by(campaign_batch=original_batch).first()
-        if not existing:
+        # Fetch the original and every -vN variant in one query (LIKE may over-match; membership decides)
+        taken = {batch for (batch,) in session.query(Campaign.campaign_batch).filter(or_(
+            Campaign.campaign_batch == original_batch,
+            Campaign.campaign_batch.like(f"{original_batch}-v%")
+        ))}
+        if original_batch not in taken:
             return original_batch
         
         # Find next available suffix
-        counter = 2
-        while counter <= 99:  # Reasonable limit
+        for counter in range(2, 100):  # Reasonable limit
             candidate = f"{original_batch}-v{counter}"
-            existing = session.query(Campaign).filter_by(campaign_batch=candidate).first()
-            if not existing:
+            if candidate not in taken:
                 return candidate
-            counter += 1
         
         # If all suffixes exhausted, add timestamp
         from datetime import datetime
@@ -850,45 +1216,69 @@ def get_unique_campaign_batch(original_batch):
         return f"{original_batch}-{timestamp}"
         
     except Exception as e:
-        print(f"DEBUG: Error getting unique campaign batch: {e}")
+        logger.warning("Error getting unique campaign batch: %s", e)
         return original_batch
     finally:
-        session.close()
+        if own_session:
+            session.close()
 
-def get_unique_tweet_id(original_id, campaign_batch):
+def get_unique_tweet_id(original_id, campaign_batch, session=None):
     """Get unique tweet ID by adding increment suffix if needed"""
     global _engine
-    if _engine is None:
-        return original_id
-    
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    own_session = session is None
+    if own_session:
+        if _engine is None:
+            return original_id
+        session = _session_factory()
     
     try:
-        # Check if original exists
-        existing = session.query(Tweet).filter_by(id=original_id).first()
-        if not existing:
+        # Fetch the original and every -vN variant in one query (LIKE may over-match; membership decides)
+        taken = {tweet_id for (tweet_id,) in session.query(Tweet.id).filter(or_(
+            Tweet.id == original_id,
+            Tweet.id.like(f"{original_id}-v%")
+        ))}
+        if original_id not in taken:
             return original_id
         
         # Find next available suffix
-        counter = 2
-        while counter <= 99:  # Reasonable limit
+        for counter in range(2, 100):  # Reasonable limit
             candidate = f"{original_id}-v{counter}"
-            existing = session.query(Tweet).filter_by(id=candidate).first()
-            if not existing:
+            if candidate not in taken:
                 return candidate
-            counter += 1
         
         # If all suffixes exhausted, add campaign suffix
         base_id = original_id.split('-')[-1] if '-' in original_id else original_id
         return f"{campaign_batch}-{base_id}"
         
     except Exception as e:
-        print(f"DEBUG: Error getting unique tweet ID: {e}")
+        logger.warning("Error getting unique tweet ID: %s", e)
         return original_id
+    finally:
+        if own_session:
+            session.close()
+
+@_serialized_write
+def update_campaign_display_name(campaign_batch, display_name):
+    """Rename a campaign - returns True if updated, False if not found, None on database error"""
+    global _engine
+    if _engine is None:
+        init_database()
+    
+    session = _session_factory()
+    try:
+        # Single UPDATE; updated_at is refreshed by the column's onupdate default
+        result = session.execute(update(Campaign).where(Campaign.campaign_batch == campaign_batch)
+                                 .values(display_name=display_name).execution_options(synchronize_session=False))
+        session.commit()
+        return result.rowcount > 0
+    except Exception as e:
+        session.rollback()
+        logger.warning("Database error updating campaign name: %s", e)
+        return None
     finally:
         session.close()
 
+@_serialized_write
 def delete_campaign_cascade(campaign_batch, hard_delete=False):
     """Delete campaign and all associated tweets with cascade
     
@@ -903,8 +1293,7 @@ def delete_campaign_cascade(campaign_batch, hard_delete=False):
     if _engine is None:
         return False, "Database not initialized", 0
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     
     try:
         # Check if campaign exists
@@ -912,14 +1301,14 @@ def delete_campaign_cascade(campaign_batch, hard_delete=False):
         if not campaign:
             return False, f"Campaign '{campaign_batch}' not found", 0
         
-        # Get associated tweets
-        tweets = session.query(Tweet).filter_by(campaign_batch=campaign_batch).all()
-        tweet_count = len(tweets)
+        # Associated tweets are changed with one set-based statement (no per-tweet ORM objects)
+        campaign_tweets = Tweet.campaign_batch == campaign_batch
         
         if hard_delete:
             # Permanently delete tweets first (foreign key constraint)
-            for tweet in tweets:
-                session.delete(tweet)
+            tweet_count = session.execute(
+                delete(Tweet).where(campaign_tweets).execution_options(synchronize_session=False)
+            ).rowcount
             
             # Delete campaign
             session.delete(campaign)
@@ -929,9 +1318,10 @@ def delete_campaign_cascade(campaign_batch, hard_delete=False):
         
         else:
             # Soft delete - mark as deleted
-            for tweet in tweets:
-                tweet.status = 'Deleted'
-                tweet.last_modified = datetime.utcnow()
+            tweet_count = session.execute(
+                update(Tweet).where(campaign_tweets).values(status='Deleted', last_modified=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount
             
             # Mark campaign with special status (we could add a status column later)
             campaign.description = f"[DELETED] {campaign.description or ''}"
@@ -942,11 +1332,12 @@ def delete_campaign_cascade(campaign_batch, hard_delete=False):
         
     except Exception as e:
         session.rollback()
-        print(f"DEBUG: Error deleting campaign: {e}")
+        logger.warning("Error deleting campaign: %s", e)
         return False, f"Delete failed: {str(e)}", 0
     finally:
         session.close()
 
+@_serialized_write
 def bulk_delete_scraped_tweets(tweet_ids):
     """Bulk delete scraped tweets by their tweet_ids
     
@@ -963,28 +1354,25 @@ def bulk_delete_scraped_tweets(tweet_ids):
     if not tweet_ids:
         return False, "No tweet IDs provided", 0
     
-    Session = sessionmaker(bind=_engine)
-    session = Session()
+    session = _session_factory()
     
     try:
-        # Get scraped tweets that match the IDs
-        scraped_tweets = session.query(ScrapedTweet).filter(ScrapedTweet.tweet_id.in_(tweet_ids)).all()
+        # Delete the matching scraped tweets in one statement
+        deleted_count = session.execute(
+            delete(ScrapedTweet).where(ScrapedTweet.tweet_id.in_(tweet_ids)).execution_options(synchronize_session=False)
+        ).rowcount
         
-        if not scraped_tweets:
+        if not deleted_count:
+            session.rollback()
             return False, "No matching scraped tweets found", 0
         
-        # Delete the scraped tweets
-        deleted_count = 0
-        for tweet in scraped_tweets:
-            session.delete(tweet)
-            deleted_count += 1
-        
         session.commit()
+        invalidate_scraped_count_cache()
         return True, f"Successfully deleted {deleted_count} scraped tweets", deleted_count
         
     except Exception as e:
         session.rollback()
-        print(f"DEBUG: Error bulk deleting scraped tweets: {e}")
+        logger.warning("Error bulk deleting scraped tweets: %s", e)
         return False, f"Bulk delete failed: {str(e)}", 0
     finally:
         session.close() 
\ No newline at end of file
@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py initializes the database at import time - point it at a throwaway file, never tweets.db
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'import.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    """Fresh SQLite file per test, with the module-level engine released first"""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    monkeypatch.setenv('DATABASE_URL', url)
+    database.dispose_engine()
+    database.invalidate_scraped_count_cache()
+    yield url
+    database.dispose_engine()
+
+
+@pytest.fixture
+def db(database_url):
+    """Initialized database module on an empty temp database"""
+    database.init_database()
+    return database
+
+
+@pytest.fixture
+def client(db):
+    """Flask test client backed by the temp database"""
+    import app
+    app._response_cache.clear()
+    app.tweet_storage.clear()
+    return app.app.test_client()
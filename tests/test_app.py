@@ -0,0 +1,227 @@
+import io
+import threading
+
+import orjson
+
+import app
+from app import CampaignStore
+from database import Campaign, Tweet
+
+
+def test_campaign_store_evicts_least_recently_used():
+    store = CampaignStore(maxsize=2)
+    store['a'] = {'tweets': []}
+    store['b'] = {'tweets': []}
+    store.get('a')  # reading marks 'a' as recently used
+    store['c'] = {'tweets': []}
+
+    assert store.keys() == ['a', 'c']
+    assert store.get('b') is None
+
+    store['a']
+    store['d'] = {'tweets': []}
+    assert store.keys() == ['a', 'd']
+
+
+def _receive(client, tweets):
+    return client.post('/api/receive-tweets', json={'campaign_batch': 'b1', 'generated_at': '2025-08-01T10:00:00', 'tweets': tweets})
+
+
+def test_receive_tweets_rejects_tweets_without_id(client):
+    response = _receive(client, [{'id': 't1', 'content': 'c'}, {'content': 'c'}, {'content': 'c'}])
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Tweet 2 must be an object with an "id" field'
+
+    response = _receive(client, [{'id': 't1', 'content': 'c'}, 'not a tweet'])
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Tweet 2 must be an object with an "id" field'
+
+
+def test_receive_tweets_rejects_duplicate_ids(client):
+    response = _receive(client, [{'id': 't1', 'content': 'c'}, {'id': 't1', 'content': 'c'}])
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Duplicate tweet IDs in payload for campaign b1'
+
+
+def test_gzip_variant_has_its_own_etag(client):
+    gzip_response = client.get('/campaigns', headers={'Accept-Encoding': 'gzip'})
+    identity_response = client.get('/campaigns', headers={'Accept-Encoding': 'identity'})
+    gzip_etag, identity_etag = gzip_response.headers['ETag'], identity_response.headers['ETag']
+    assert gzip_response.headers['Content-Encoding'] == 'gzip'
+    assert gzip_etag != identity_etag
+
+    revalidated = client.get('/campaigns', headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzip_etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == gzip_etag
+    assert 'Accept-Encoding' in revalidated.headers['Vary']
+
+    crossed = client.get('/campaigns', headers={'Accept-Encoding': 'gzip', 'If-None-Match': identity_etag})
+    assert crossed.status_code == 200
+
+
+def test_gzip_refused_with_zero_q_value(client):
+    identity_etag = client.get('/campaigns', headers={'Accept-Encoding': 'identity'}).headers['ETag']
+    for accept_encoding in ('gzip;q=0', 'identity, gzip;q=0'):
+        response = client.get('/campaigns', headers={'Accept-Encoding': accept_encoding})
+        assert 'Content-Encoding' not in response.headers
+        assert response.headers['ETag'] == identity_etag
+
+
+def test_async_ingest_sheds_load_when_queue_is_full(client, monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()  # the only slot is taken by a save still in flight
+    monkeypatch.setattr(app, 'ASYNC_INGEST', True)
+    monkeypatch.setattr(app, '_db_slots', slots)
+
+    response = _receive(client, [{'id': 't1', 'content': 'c'}])
+    assert response.status_code == 503
+    assert response.get_json()['message'] == 'Ingest queue is full, retry shortly'
+
+
+def test_static_pages_render_once(client, monkeypatch):
+    renders = []
+    render_template = app.render_template
+
+    def counting_render(name, **context):
+        renders.append(name)
+        return render_template(name, **context)
+
+    monkeypatch.setattr(app, 'render_template', counting_render)
+    monkeypatch.setattr(app, '_STATIC_HTML', {})
+
+    first = client.get('/campaigns', headers={'Accept-Encoding': 'identity'})
+    second = client.get('/campaigns', headers={'Accept-Encoding': 'identity'})
+    assert first.status_code == second.status_code == 200
+    assert first.get_data() == second.get_data()
+    assert len(renders) == 1
+
+
+def test_status_listing_is_paged_by_default(client, db):
+    session = db._session_factory()
+    session.add_all(Tweet(id=f't{i:03}', campaign_batch='b1', status='Draft') for i in range(app._STATUS_PAGE_DEFAULT + 5))
+    session.commit()
+    session.close()
+
+    first = client.get('/api/tweets-by-status/draft').get_json()
+    assert len(first['tweets']) == app._STATUS_PAGE_DEFAULT
+    assert first['next_cursor']
+
+    rest = client.get('/api/tweets-by-status/draft', query_string={'cursor': first['next_cursor']}).get_json()
+    assert len(rest['tweets']) == 5
+    assert rest['next_cursor'] is None
+    assert {t['id'] for t in first['tweets']}.isdisjoint(t['id'] for t in rest['tweets'])
+
+
+def test_status_listing_rejects_malformed_cursor(client, db):
+    session = db._session_factory()
+    session.add_all(Tweet(id=f't{i}', campaign_batch='b1', status='Draft') for i in range(3))
+    session.commit()
+    session.close()
+    cursor = client.get('/api/tweets-by-status/draft', query_string={'limit': 2}).get_json()['next_cursor']
+
+    for bad_cursor in ('garbage!!', cursor[:-4]):
+        response = client.get('/api/tweets-by-status/draft', query_string={'limit': 2, 'cursor': bad_cursor})
+        assert response.status_code == 400
+        assert response.get_json()['message'] == 'Invalid cursor'
+
+
+def test_scraped_page_ignores_malformed_cursor(client, db):
+    tweets = [{'Tweet ID': f'scraped-{i:03}', 'URL': 'u', 'Content': 'c', 'Date': 'Mon Aug 04 17:15:25 +0000 2025'} for i in range(55)]
+    db.save_scraped_tweets(tweets, 'exec-1', 'https://n8n')
+
+    response = client.get('/scraped-tweets', query_string={'page': 2, 'cursor': 'garbage!!'})
+    assert response.status_code == 200
+    assert b'scraped-000' in response.get_data()
+    assert b'scraped-054' not in response.get_data()
+
+
+def _scraped_payload(*tweet_ids, execution_id='exec-1'):
+    return {
+        'execution_id': execution_id,
+        'source_url': 'https://n8n',
+        'tweets': [{'Tweet ID': tweet_id, 'URL': 'https://x.com/i', 'Content': 'c', 'Date': 'Mon Aug 04 17:15:25 +0000 2025'}
+                   for tweet_id in tweet_ids],
+    }
+
+
+def test_store_scraped_tweets_reports_skipped_duplicates(client):
+    first = client.post('/api/store-scraped-tweets', json=_scraped_payload('1', '2'))
+    assert first.status_code == 200
+    assert first.get_json()['stored_count'] == 2
+
+    repeat = client.post('/api/store-scraped-tweets', json=_scraped_payload('1', '2', execution_id='exec-2'))
+    body = repeat.get_json()
+    assert repeat.status_code == 200
+    assert body['status'] == 'success'
+    assert (body['stored_count'], body['skipped_count'], body['error_count']) == (0, 2, 0)
+
+
+def test_cached_json_reuses_body_until_a_write(client):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'builds': len(builds)}
+
+    with app.app.test_request_context():
+        assert app._cached_json('test', 60, build).get_json() == {'builds': 1}
+        assert app._cached_json('test', 60, build).get_json() == {'builds': 1}
+        app._clear_response_cache()
+        assert app._cached_json('test', 60, build).get_json() == {'builds': 2}
+
+
+def test_cached_json_drops_build_that_straddles_a_write(client):
+    builds = []
+
+    def build():
+        builds.append(1)
+        app._clear_response_cache()  # a write commits while this build is reading
+        return {'builds': len(builds)}
+
+    with app.app.test_request_context():
+        assert app._cached_json('test', 60, build).get_json() == {'builds': 1}
+        assert 'test' not in app._response_cache
+        assert app._cached_json('test', 60, build).get_json() == {'builds': 2}
+
+
+def test_update_campaign_name_not_found(client):
+    response = client.post('/api/update-campaign-name', json={'campaign_batch': 'missing', 'display_name': 'N'})
+    assert response.status_code == 404
+
+
+def _campaign(i):
+    return {'campaign_batch': f'batch-{i}', 'generated_at': '2025-08-01T10:00:00', 'tweet_count': 1,
+            'tweets': [{'id': f'tweet-{i}', 'type': 'x', 'content': 'c', 'character_count': 1}]}
+
+
+def _upload(client, body):
+    return client.post('/api/upload-json', data={'file': (io.BytesIO(body), 'upload.json')},
+                       content_type='multipart/form-data')
+
+
+def test_upload_reports_batches_saved_before_parse_error(client, db):
+    campaigns = [_campaign(i) for i in range(60)]
+    # The first 50 campaigns are committed as one batch before the parser reaches the damage
+    body = orjson.dumps(campaigns)[:-1] + b', {"campaign_batch": '
+
+    response = _upload(client, body)
+    result = response.get_json()
+    assert response.status_code == 200
+    assert result['status'] == 'partial'
+    assert [c['campaign_batch'] for c in result['campaigns']] == [f'batch-{i}' for i in range(50)]
+    assert {c['status'] for c in result['campaigns']} == {'saved to database'}
+
+    session = db._session_factory()
+    assert session.query(Campaign).count() == 50
+    assert session.query(Tweet).count() == 50
+    session.close()
+
+
+def test_upload_parse_error_before_any_save_is_rejected(client, db):
+    response = _upload(client, orjson.dumps([_campaign(0)])[:-1] + b', {bad')
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Invalid JSON format'
+
+    session = db._session_factory()
+    assert session.query(Campaign).count() == 0
+    session.close()
@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.schema import CreateTable
+
+import database
+from database import Base, Campaign, DatabaseVersion, ScrapedTweet, Tweet
+
+
+def test_keyset_cursor_round_trip():
+    when = datetime(2025, 8, 4, 17, 15, 25, 123456)
+    assert database.decode_keyset_cursor(database.encode_keyset_cursor(when, 'id|with|pipes')) == (when, 'id|with|pipes')
+    assert database.decode_keyset_cursor(database.encode_keyset_cursor(None, 't1')) == (None, 't1')
+    assert database.decode_keyset_cursor('not a cursor!') is None
+    assert database.decode_keyset_cursor(database.encode_keyset_cursor(when, 't1')[:-4]) is None
+
+
+def test_status_pages_follow_cursor_through_null_last_modified(db):
+    base = datetime(2025, 8, 1)
+    session = db._session_factory()
+    for i in range(5):
+        session.add(Tweet(id=f't{i}', campaign_batch='a', status='Approved', last_modified=base + timedelta(minutes=i)))
+    session.add(Tweet(id='t5', campaign_batch='a', status='approved', last_modified=base + timedelta(minutes=4)))
+    session.commit()
+    session.execute(Tweet.__table__.update().where(Tweet.id.in_(['t0', 't1'])).values(last_modified=None))
+    session.commit()
+    session.close()
+
+    seen, cursor = [], None
+    while True:
+        tweets, cursor = db.get_status_tweets_page('APPROVED', limit=2, cursor=cursor)
+        seen.extend(tweet['id'] for tweet in tweets)
+        if not cursor:
+            break
+    assert seen == ['t5', 't4', 't3', 't2', 't1', 't0']
+
+
+def _scraped(tweet_id, **fields):
+    tweet = {'Tweet ID': tweet_id, 'URL': 'https://x.com/i', 'Content': 'c', 'Date': 'Mon Aug 04 17:15:25 +0000 2025'}
+    tweet.update(fields)
+    return tweet
+
+
+def test_scraped_pages_follow_cursor_through_null_dates(db):
+    tweets = [_scraped(str(i)) for i in range(4)] + [_scraped(str(i), Date='') for i in range(4, 7)]
+    assert db.save_scraped_tweets(tweets, 'exec-1', 'https://n8n')[:2] == (7, 0)
+
+    page, total, cursor = db.get_scraped_tweets_page(3)
+    seen = [tweet['Tweet ID'] for tweet in page]
+    while cursor:
+        page, total, cursor = db.get_scraped_tweets_page(3, cursor=cursor)
+        seen.extend(tweet['Tweet ID'] for tweet in page)
+    assert total == 7
+    assert seen == ['3', '2', '1', '0', '6', '5', '4']
+    assert seen == [tweet['Tweet ID'] for tweet in db.iter_scraped_tweets()]
+
+
+def test_duplicate_scraped_tweets_are_skipped_not_failed(db):
+    assert db.save_scraped_tweets([_scraped('1'), _scraped('2')], 'exec-1', 'https://n8n') == (2, 0, [], 0)
+
+    stored, errors, messages, skipped = db.save_scraped_tweets([_scraped('2'), _scraped('3')], 'exec-2', 'https://n8n')
+    assert (stored, errors, messages, skipped) == (1, 0, [], 1)
+
+    session = db._session_factory()
+    assert session.query(ScrapedTweet).count() == 3
+    assert session.get(ScrapedTweet, '2').execution_id == 'exec-1'
+    session.close()
+
+
+def test_all_tweet_export_reaches_null_campaign_batch(db):
+    session = db._session_factory()
+    session.add_all([Campaign(campaign_batch='a'), Campaign(campaign_batch='b')])
+    for i in range(3):
+        session.add_all([
+            Tweet(id=f'a{i}', campaign_batch='a', content='c'),
+            Tweet(id=f'b{i}', campaign_batch='b', content='c'),
+            Tweet(id=f'n{i}', campaign_batch=None, content='c'),
+        ])
+    session.commit()
+    session.close()
+
+    # Batches of 2 put cursor boundaries inside and across every campaign, including the NULL block
+    ids = [tweet['id'] for tweet in db.iter_all_tweets(batch_size=2)]
+    assert ids == ['b0', 'b1', 'b2', 'a0', 'a1', 'a2', 'n0', 'n1', 'n2']
+    assert [row[0] for row in db.iter_all_tweet_csv_rows(batch_size=4)] == ids
+
+
+def test_update_campaign_display_name(db):
+    assert db.save_campaign_data({'campaign_batch': 'b1', 'generated_at': '2025-08-01T10:00:00', 'tweet_count': 0, 'tweets': []})
+
+    assert db.update_campaign_display_name('b1', 'Renamed') is True
+    assert db.update_campaign_display_name('missing', 'Renamed') is False
+
+    session = db._session_factory()
+    assert session.get(Campaign, 'b1').display_name == 'Renamed'
+    session.close()
+
+
+def _campaign(batch, *tweet_ids):
+    return {'campaign_batch': batch, 'generated_at': '2025-08-01T10:00:00', 'tweet_count': len(tweet_ids),
+            'tweets': [{'id': tweet_id, 'type': 'x', 'content': 'c', 'character_count': 1} for tweet_id in tweet_ids]}
+
+
+def test_bulk_save_falls_back_to_single_saves_after_integrity_error(db, monkeypatch):
+    single_saves = []
+    save_campaign_data = db.save_campaign_data
+
+    def counting_save(campaign_data):
+        single_saves.append(campaign_data['campaign_batch'])
+        return save_campaign_data(campaign_data)
+
+    monkeypatch.setattr(db, 'save_campaign_data', counting_save)
+
+    # The repeated id inside 'bad' fails the batch INSERT; the retry saves the others one at a time
+    campaigns = [_campaign('good-1', 'g1'), _campaign('bad', 'dup', 'dup'), _campaign('good-2', 'g2')]
+    assert db.save_campaigns_bulk(campaigns) == [True, False, True]
+    assert single_saves == ['good-1', 'bad', 'good-2']
+
+    session = db._session_factory()
+    assert sorted(batch for (batch,) in session.query(Campaign.campaign_batch)) == ['good-1', 'good-2']
+    assert sorted(tweet_id for (tweet_id,) in session.query(Tweet.id)) == ['g1', 'g2']
+    session.close()
+
+
+def _create_v3_database(url):
+    """Tables as they stood at version 3 - columns only, none of the indexes added since"""
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+        conn.execute(insert(DatabaseVersion).values(version=3, migration_notes='Version 3 fixture'))
+    engine.dispose()
+
+
+def _index_names():
+    with database._engine.connect() as conn:
+        return {name for (name,) in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+
+
+def test_migrates_v3_database_to_current_version(database_url):
+    _create_v3_database(database_url)
+
+    assert database.init_database() is not None
+    assert database.get_database_version() == database.CURRENT_DB_VERSION
+
+    expected = {index.name for table in Base.metadata.sorted_tables for index in table.indexes}
+    assert expected <= _index_names()
+    assert 'ix_tweets_status_lower' not in _index_names()
+
+
+def test_migration_is_idempotent(database_url):
+    _create_v3_database(database_url)
+    database.init_database()
+    database.dispose_engine()
+
+    assert database.init_database() is not None
+    assert database.get_database_version() == database.CURRENT_DB_VERSION
+
+
+def test_parse_twitter_date_fast_path_matches_strptime():
+    for value in ('Mon Aug 04 17:15:25 +0000 2025', 'Thu Jan 01 00:00:00 +0000 2026', 'Tue Dec 31 23:59:59 +0000 2024'):
+        assert database._parse_twitter_date(value) == datetime.strptime(value, '%a %b %d %H:%M:%S %z %Y')
+
+
+def test_parse_twitter_date_falls_back_to_strptime():
+    # Non-UTC offsets take the strptime path and keep their offset
+    parsed = database._parse_twitter_date('Mon Aug 04 19:15:25 +0200 2025')
+    assert parsed == datetime(2025, 8, 4, 17, 15, 25, tzinfo=timezone.utc)
+    assert parsed.utcoffset() == timedelta(hours=2)
+
+    # A malformed UTC value fails the slice and gets strptime's error
+    with pytest.raises(ValueError):
+        database._parse_twitter_date('Mon Aug 34 17:15:25 +0000 2025')
+    with pytest.raises(ValueError):
+        database._parse_twitter_date('yesterday')
+
+
+def test_check_duplicate_scraped_tweets(db):
+    db.save_scraped_tweets([_scraped('1'), _scraped('2')], 'exec-1', 'https://n8n')
+
+    existing_ids, new_ids = db.check_duplicate_scraped_tweets(['1', '3', '4'])
+    assert (sorted(existing_ids), new_ids) == (['1'], ['3', '4'])
+
+    # Rows from the same execution count as duplicates even when their ids were not asked about
+    existing_ids, new_ids = db.check_duplicate_scraped_tweets(['3'], execution_id='exec-1')
+    assert (sorted(existing_ids), new_ids) == (['1', '2'], ['3'])